@@ -0,0 +1,84 @@
+# ./scripts/_export_common.py
+"""
+Shared helpers for the export scripts (export_manifests, export_prompts, export_questions,
+export_schemas, export_all) and generate_schema_snapshots. Not a script itself.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# ANSI Colors
+RED = "\033[91m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+def find_phase_dirs(data_dir):
+    """
+    Returns (phase_name, path) for every data/phase_* directory from a single scandir pass, sorted by path.
+    """
+    with os.scandir(data_dir) as entries:
+        phase_dirs = [(entry.name, entry.path) for entry in entries
+                      if entry.name.startswith("phase_") and entry.is_dir()]
+    phase_dirs.sort(key=lambda item: item[1])
+    return phase_dirs
+
+def list_files(dir_path):
+    """
+    Returns the names of the regular files in a directory from a single scandir pass.
+    A missing directory has no files.
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+def find_phase_files(data_dir, filename):
+    """Returns (phase_name, path) for every data/phase_*/<filename>, sorted by file path."""
+    found = []
+    for phase_name, phase_path in find_phase_dirs(data_dir):
+        path = os.path.join(phase_path, filename)
+        if os.path.isfile(path):
+            found.append((phase_name, path))
+    # Sorting by file path (not directory) keeps the old glob order: phase_1.5/ before phase_1/
+    found.sort(key=lambda item: item[1])
+    return found
+
+def run_concurrently(export, jobs):
+    """
+    Runs export(job) for every job in a thread pool and returns the results in job order.
+    Each phase file is independent, so the exports overlap; callers print messages from the ordered results.
+    """
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(export, jobs))
+
+def export_text_file(convert_to_text, suffix, phase_dir, file_path, export_dir):
+    """Loads one phase JSON file and writes its text export. Returns (exported, message or None)."""
+    try:
+        with open(file_path, 'rb') as f:
+            data = json.loads(f.read())
+    except Exception as e:
+        return False, f"{RED}Error loading {file_path}: {e}{RESET}"
+    
+    return write_text_export(convert_to_text, suffix, phase_dir, data, export_dir)
+
+def write_text_export(convert_to_text, suffix, phase_dir, data, export_dir):
+    """
+    Writes convert_to_text(data, phase_dir) to {phase_dir}_{suffix}.txt for already-parsed data.
+    Returns (exported, message or None); empty data is skipped silently.
+    """
+    target_name = f"{phase_dir}_{suffix}.txt"
+    target_path = os.path.join(export_dir, target_name)
+    
+    if not data:
+        return False, None
+    
+    try:
+        formatted_text = convert_to_text(data, phase_dir)
+        with open(target_path, 'w', encoding='utf-8') as f:
+            f.write(formatted_text)
+        
+        return True, f"Exported {BOLD}{phase_dir}{RESET} -> {target_name}"
+    except Exception as e:
+        return False, f"{RED}Failed to write {target_name}: {e}{RESET}"
@@ -1,5 +1,7 @@
 import json
 import os
+import sys
+from typing import NamedTuple
 
 # Define the phases to checks
 PHASES = ['phase_0', 'phase_1', 'phase_1.5', 'phase_2', 'phase_2.5']
@@ -17,25 +19,31 @@ GENERIC_LABELS = [
     # Let's list what we find first.
 ]
 
-DEFINITELY_GENERIC = [
-    "Notes",
-    "Notes (optional)",
+# Compared against label.lower(), so only lowercase forms are needed
+DEFINITELY_GENERIC = frozenset({
     "notes",
     "notes (optional)"
-]
+})
+
+class PhaseStats(NamedTuple):
+    generic: int
+    lines: int
 
-def analyze_file(phase):
+def analyze_file(phase, write=None):
+    """Analyze one phase's notes fields, sending report lines to `write` (default: the current sys.stdout)."""
+    # Resolved per call so a redirected or captured sys.stdout is honoured
+    write = write or sys.stdout.write
     file_path = os.path.join(DATA_DIR, phase, 'questions.json')
     if not os.path.exists(file_path):
-        print(f"Skipping {phase}: File not found")
-        return
+        write(f"Skipping {phase}: File not found\n")
+        return PhaseStats(0, 0)
 
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open(file_path, 'rb') as f:
         try:
-            data = json.load(f)
+            data = json.loads(f.read())
         except json.JSONDecodeError:
-            print(f"Skipping {phase}: Invalid JSON")
-            return
+            write(f"Skipping {phase}: Invalid JSON\n")
+            return PhaseStats(0, 0)
 
     questions = data.get('questions', {})
     
@@ -44,9 +52,8 @@ def analyze_file(phase):
     specific_notes_fields = 0
     
     saved_lines_estimate = 0
-    saved_chars_estimate = 0
 
-    print(f"\n--- Analysis for {phase} ---")
+    write(f"\n--- Analysis for {phase} ---\n")
 
     for q_id, q_data in questions.items():
         if q_data.get('type') == 'compound':
@@ -57,7 +64,7 @@ def analyze_file(phase):
                     label = field.get('label', '')
                     
                     # Heuristic for generic: Exact match or very simple
-                    is_generic = label in DEFINITELY_GENERIC or label.lower() == "notes (optional)" or label.lower() == "notes"
+                    is_generic = label.lower() in DEFINITELY_GENERIC
                     
                     if is_generic:
                         generic_notes_fields += 1
@@ -65,18 +72,16 @@ def analyze_file(phase):
                         # - json block for field approx 5-8 lines
                         # - entry in answer_schema approx 1 line
                         saved_lines_estimate += 6 
-                        # Rough char count
-                        saved_chars_estimate += len(str(field)) + 20 # +20 for schema entry
                     else:
                         specific_notes_fields += 1
-                        print(f"  [Specific] {q_id}: \"{label}\"")
+                        write(f"  [Specific] {q_id}: \"{label}\"\n")
 
-    print(f"Total 'notes' fields: {total_notes_fields}")
-    print(f"Generic (Removable): {generic_notes_fields}")
-    print(f"Specific (Keep):     {specific_notes_fields}")
-    print(f"Est. Lines Saved:    {saved_lines_estimate}")
+    write(f"Total 'notes' fields: {total_notes_fields}\n")
+    write(f"Generic (Removable): {generic_notes_fields}\n")
+    write(f"Specific (Keep):     {specific_notes_fields}\n")
+    write(f"Est. Lines Saved:    {saved_lines_estimate}\n")
     
-    return generic_notes_fields, saved_lines_estimate
+    return PhaseStats(generic_notes_fields, saved_lines_estimate)
 
 def main():
     output_lines = []
@@ -101,51 +106,15 @@ def main():
         outfile.write("Analysis Report\n")
         
         for phase in PHASES:
-            generic, lines = analyze_file_to_log(phase, outfile)
-            total_generic += generic
-            total_lines += lines
+            stats = analyze_file(phase, outfile.write)
+            total_generic += stats.generic
+            total_lines += stats.lines
             
         outfile.write("\n========================================\n")
         outfile.write(f"GRAND TOTALS\n")
         outfile.write(f"Generic fields to remove: {total_generic}\n")
         outfile.write(f"Estimated lines saved:    {total_lines}\n")
         outfile.write("========================================\n")
-        
-def analyze_file_to_log(phase, outfile):
-    file_path = os.path.join(DATA_DIR, phase, 'questions.json')
-    if not os.path.exists(file_path):
-        outfile.write(f"Skipping {phase}: File not found\n")
-        return 0, 0
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        try:
-            data = json.load(f)
-        except json.JSONDecodeError:
-            outfile.write(f"Skipping {phase}: Invalid JSON\n")
-            return 0, 0
-
-    questions = data.get('questions', {})
-    
-    generic_notes_fields = 0
-    saved_lines_estimate = 0
-
-    outfile.write(f"\n--- Analysis for {phase} ---\n")
-
-    for q_id, q_data in questions.items():
-        if q_data.get('type') == 'compound':
-            fields = q_data.get('fields', [])
-            for field in fields:
-                if field.get('key') == 'notes':
-                    label = field.get('label', '')
-                    is_generic = label in DEFINITELY_GENERIC or label.lower() == "notes (optional)" or label.lower() == "notes"
-                    
-                    if is_generic:
-                        generic_notes_fields += 1
-                        saved_lines_estimate += 6 
-                    else:
-                        outfile.write(f"  [Specific] {q_id}: \"{label}\"\n")
-
-    return generic_notes_fields, saved_lines_estimate
 
 
 if __name__ == '__main__':
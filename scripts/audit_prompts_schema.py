@@ -22,11 +22,12 @@ Operational Notes:
     - Checks for required prompt types and internal structure (inputs, context, output_format).
 """
 
+import functools
 import json
-import glob
 import os
 import sys
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any
 
 # ANSI Colors for output
 GREEN = "\033[92m"
@@ -41,6 +42,7 @@ REQUIRED_PROMPT_TYPES = [
     "couple_reflection_lite",
     "couple_reflection_full"
 ]
+REQUIRED_PROMPT_TYPE_SET = frozenset(REQUIRED_PROMPT_TYPES)
 
 REQUIRED_PROMPT_FIELDS = [
     "id",
@@ -53,13 +55,19 @@ REQUIRED_PROMPT_FIELDS = [
     "constraints"
 ]
 
-def load_json(path: str) -> Optional[Dict[str, Any]]:
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"{RED}Error loading {path}: {e}{RESET}")
-        return None
+@functools.lru_cache(maxsize=256)
+def _load_json_cached(path: str, mtime: float) -> Dict[str, Any]:
+    # mtime is part of the cache key so an edited file is re-read
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+def load_json(path: str) -> Dict[str, Any]:
+    """Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    Load errors are raised so the caller can report them with the file they belong to.
+    """
+    return _load_json_cached(path, os.path.getmtime(path))
 
 def validate_input_schema(inputs: List[Dict[str, Any]], context_prefix: str) -> List[str]:
     errors = []
@@ -99,9 +107,11 @@ def validate_output_format_schema(output_format: List[Dict[str, Any]], context_p
 
 def audit_file(file_path: str) -> List[str]:
     errors = []
-    data = load_json(file_path)
-    if data is None:
-        return [f"Could not load file definition"]
+    try:
+        data = load_json(file_path)
+    except Exception as e:
+        # Reported with this file's results; printing here would interleave with other workers
+        return [f"Could not load file definition: {e}"]
 
     if "prompts" not in data:
         return ["Missing root key: 'prompts'"]
@@ -110,9 +120,8 @@ def audit_file(file_path: str) -> List[str]:
     
     # Check for extra or missing prompt types
     existing_keys = set(prompts_data.keys())
-    required_keys = set(REQUIRED_PROMPT_TYPES)
     
-    missing = required_keys - existing_keys
+    missing = REQUIRED_PROMPT_TYPE_SET - existing_keys
     if missing:
         errors.append(f"Missing prompt types: {', '.join(missing)}")
     
@@ -120,7 +129,7 @@ def audit_file(file_path: str) -> List[str]:
     for prompt_type in existing_keys:
         # If it's a known prompt type, validate structure. 
         # (We could also optionally flag unknown keys, but let's stick to validating known ones first)
-        if prompt_type not in REQUIRED_PROMPT_TYPES:
+        if prompt_type not in REQUIRED_PROMPT_TYPE_SET:
             # Uncomment if we want strict schema
             # errors.append(f"Unknown prompt key found: '{prompt_type}'")
             continue
@@ -129,9 +138,9 @@ def audit_file(file_path: str) -> List[str]:
         context_prefix = f"prompts.{prompt_type}"
 
         # 1. Structural fields
-        for field in REQUIRED_PROMPT_FIELDS:
-            if field not in prompt_obj:
-                errors.append(f"{context_prefix}: Missing field '{field}'")
+        missing_fields = [field for field in REQUIRED_PROMPT_FIELDS if field not in prompt_obj]
+        if missing_fields:
+            errors.append(f"{context_prefix}: Missing required fields: {', '.join(missing_fields)}")
         
         # 2. Type validation for list fields
         if "context" in prompt_obj and not isinstance(prompt_obj["context"], list):
@@ -157,9 +166,14 @@ def main():
         print(f"{RED}Error: Data directory not found at {base_dir}{RESET}")
         sys.exit(1)
 
-    # Find prompt files
-    pattern = os.path.join(base_dir, "phase_*", "prompts.json")
-    files = glob.glob(pattern)
+    # Find prompt files (single directory pass; DirEntry caches the file type)
+    with os.scandir(base_dir) as entries:
+        files = [
+            os.path.join(entry.path, "prompts.json")
+            for entry in entries
+            if entry.name.startswith("phase_") and entry.is_dir()
+            and os.path.isfile(os.path.join(entry.path, "prompts.json"))
+        ]
     
     if not files:
         print(f"{YELLOW}No phase_*/prompts.json files found.{RESET}")
@@ -172,23 +186,25 @@ def main():
     total_errors = 0
     files_with_errors = 0
 
-    for file_path in files:
+    # Files are independent, so audit them concurrently; map() keeps the
+    # results in sorted order for reporting.
+    with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+        results = list(executor.map(audit_file, files))
+
+    for file_path, file_errors in zip(files, results):
         # Relative path for display
         rel_path = os.path.relpath(file_path, os.path.dirname(os.path.dirname(__file__)))
         
-        print(f"Checking {BOLD}{rel_path}{RESET}...", end=" ")
-        
-        file_errors = audit_file(file_path)
-        
         if not file_errors:
-            print(f"{GREEN}OK{RESET}")
+            sys.stdout.write(f"Checking {BOLD}{rel_path}{RESET}... {GREEN}OK{RESET}\n")
         else:
-            print(f"{RED}FAIL{RESET}")
             files_with_errors += 1
-            for err in file_errors:
-                print(f"  - {err}")
-                total_errors += 1
-            print("") # newline separation
+            total_errors += len(file_errors)
+            # One write per file instead of one print per error
+            out = [f"Checking {BOLD}{rel_path}{RESET}... {RED}FAIL{RESET}\n"]
+            out.extend(f"  - {err}\n" for err in file_errors)
+            out.append("\n") # newline separation
+            sys.stdout.write("".join(out))
 
     print("-" * 40)
     if total_errors == 0:
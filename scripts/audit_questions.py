@@ -46,13 +46,24 @@ GitHub: https://github.com/imyourboyroy
 """
 
 import json
+import os
+import re
 import sys
 import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, Iterator, List, Tuple, Optional, Set, TextIO
 from collections import defaultdict
 
 
+SEPARATOR = "=" * 70
+
+
+def load_json(path: Path) -> Dict:
+    """Load a JSON file."""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
 class QuestionAuditor:
     """Audits questionnaire questions for quality and completeness."""
     
@@ -66,6 +77,27 @@ class QuestionAuditor:
         'compound_fields'
     ]
     
+    ISSUE_TYPES = (
+        'missing_examples',
+        'empty_examples',
+        'multi_select_no_limit',
+        'potential_ranking_candidates',
+        'long_prompts',
+        'questions_without_options',
+        'compound_without_fields'
+    )
+    
+    # Issues are stored as tuples; these name their positions for reporting
+    DEFAULT_ISSUE_FIELDS = ('qid', 'title')
+    ISSUE_FIELDS = {
+        'potential_ranking_candidates': ('qid', 'title', 'type'),
+        'long_prompts': ('qid', 'title', 'length'),
+        'questions_without_options': ('qid', 'title', 'type'),
+    }
+    
+    RANKING_KEYWORDS = ('top', 'rank', 'priority', 'most important', 'order')
+    RANKING_RE = re.compile('|'.join(re.escape(kw) for kw in RANKING_KEYWORDS), re.IGNORECASE)
+    
     def __init__(self, data_dir: Path, enabled_checks: Optional[List[str]] = None, verbose: bool = False):
         self.data_dir = data_dir
         self.enabled_checks = set(enabled_checks) if enabled_checks else set(self.ALL_CHECKS)
@@ -79,10 +111,12 @@ class QuestionAuditor:
     
     def discover_phases(self) -> List[str]:
         """Auto-discover all phase directories."""
-        phases = []
-        for item in self.data_dir.iterdir():
-            if item.is_dir() and item.name.startswith("phase"):
-                phases.append(item.name)
+        # DirEntry.is_dir() uses the type cached by scandir, avoiding a stat per entry
+        with os.scandir(self.data_dir) as entries:
+            phases = [
+                entry.name for entry in entries
+                if entry.name.startswith("phase") and entry.is_dir()
+            ]
         phases.sort()
         return phases
     
@@ -101,20 +135,18 @@ class QuestionAuditor:
             }
         
         # Load phase data
-        with open(questions_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(questions_path)
         
         # Get phase title from manifest if available
         phase_title = phase_name
         if manifest_path.exists():
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-                phase_title = manifest.get("artifact", {}).get("title", phase_name)
+            manifest = load_json(manifest_path)
+            phase_title = manifest.get("artifact", {}).get("title", phase_name)
         
         self.log(f"Auditing {phase_name} ({phase_title})")
         
         # Initialize results
-        issues = defaultdict(list)
+        issues = {issue_type: [] for issue_type in self.ISSUE_TYPES}
         stats = {
             'total': len(data.get('questions', {})),
             'by_type': defaultdict(int),
@@ -129,268 +161,237 @@ class QuestionAuditor:
         lite_ids = set(manifests.get('lite', {}).get('question_ids', []))
         full_ids = set(manifests.get('full', {}).get('question_ids', []))
         
-        # Process each question
+        # Manifest stats via set intersection rather than per-question lookups
         questions = data.get('questions', {})
-        for qid in sorted(questions.keys(), key=lambda x: questions[x].get('order', 0)):
-            q = questions[qid]
+        stats['lite_count'] = len(lite_ids.intersection(questions))
+        stats['full_only_count'] = len((full_ids - lite_ids).intersection(questions))
+        
+        # Resolve enabled checks once, in ALL_CHECKS order
+        checks = tuple(check in self.enabled_checks for check in self.ALL_CHECKS)
+        
+        # Process each question
+        for qid, q in questions.items():
             q_type = q.get('type', 'unknown')
             stats['by_type'][q_type] += 1
             
-            # Manifest stats
-            if qid in lite_ids:
-                stats['lite_count'] += 1
-            if qid in full_ids and qid not in lite_ids:
-                stats['full_only_count'] += 1
-            
-            # Run enabled checks
-            if 'missing_examples' in self.enabled_checks:
-                self._check_examples(qid, q, issues, stats)
-            
-            if 'validation' in self.enabled_checks:
-                self._check_validation(qid, q, issues, stats)
-            
-            if 'multi_select_limits' in self.enabled_checks:
-                self._check_multi_select_limits(qid, q, q_type, issues)
-            
-            if 'ranking_candidates' in self.enabled_checks:
-                self._check_ranking_candidates(qid, q, q_type, issues)
-            
-            if 'long_prompts' in self.enabled_checks:
-                self._check_long_prompts(qid, q, issues)
-            
-            if 'options_review' in self.enabled_checks:
-                self._check_options(qid, q, q_type, issues)
-            
-            if 'compound_fields' in self.enabled_checks:
-                self._check_compound_fields(qid, q, q_type, issues)
+            self._audit_question(qid, q, q_type, checks, issues, stats)
+        
+        # Checks don't depend on visiting order; sort issues once for stable reports
+        for issue_list in issues.values():
+            issue_list.sort(key=lambda item: item[0])
         
         return {
             'phase': phase_name,
             'phase_title': phase_title,
             'stats': dict(stats),
-            'issues': dict(issues)
+            'issues': issues
         }
     
-    def _check_examples(self, qid: str, q: Dict, issues: Dict, stats: Dict) -> None:
-        """Check for missing or empty examples."""
-        examples = q.get('examples', [])
-        if not examples:
-            issues['missing_examples'].append({
-                'qid': qid,
-                'title': q.get('title', '')
-            })
-        elif all(e.strip() == '' for e in examples):
-            issues['empty_examples'].append({
-                'qid': qid,
-                'title': q.get('title', '')
-            })
-        else:
-            stats['with_examples'] += 1
-    
-    def _check_validation(self, qid: str, q: Dict, issues: Dict, stats: Dict) -> None:
-        """Check validation coverage."""
-        has_validation = False
+    def _audit_question(self, qid: str, q: Dict, q_type: str, checks: Tuple[bool, ...],
+                        issues: Dict, stats: Dict) -> None:
+        """Run all enabled checks against one question in a single pass."""
+        (check_examples, check_validation, check_limits, check_ranking,
+         check_prompts, check_options, check_compound) = checks
         
-        if q.get('validation'):
-            has_validation = True
-        elif q.get('type') == 'compound':
-            if any(f.get('validation') for f in q.get('fields', [])):
-                has_validation = True
+        title = q.get('title', '')
+        prompt = q.get('prompt', '')
+        validation = q.get('validation')
+        is_compound = q_type == 'compound'
+        fields = q.get('fields', []) if is_compound else []
         
-        if has_validation:
-            stats['with_validation'] += 1
-    
-    def _check_multi_select_limits(self, qid: str, q: Dict, q_type: str, issues: Dict) -> None:
-        """Check multi-select questions for max limits."""
-        if q_type == 'multi_select':
-            if not q.get('validation', {}).get('max_selected'):
-                issues['multi_select_no_limit'].append({
-                    'qid': qid,
-                    'title': q.get('title', '')
-                })
-    
-    def _check_ranking_candidates(self, qid: str, q: Dict, q_type: str, issues: Dict) -> None:
-        """Check for questions that might benefit from ranking."""
-        prompt = q.get('prompt', '').lower()
-        title = q.get('title', '').lower()
-        combined = prompt + ' ' + title
-        ranking_keywords = ['top', 'rank', 'priority', 'most important', 'order']
+        # Missing or empty examples
+        if check_examples:
+            examples = q.get('examples', [])
+            if not examples:
+                issues['missing_examples'].append((qid, title))
+            elif all(e.strip() == '' for e in examples):
+                issues['empty_examples'].append((qid, title))
+            else:
+                stats['with_examples'] += 1
         
-        has_ranking = False
-        if q_type == 'compound':
-            for field in q.get('fields', []):
-                if field.get('type') == 'ranked_select':
-                    has_ranking = True
-                    break
+        # Validation coverage (question-level or any compound field)
+        if check_validation:
+            if validation or any(f.get('validation') for f in fields):
+                stats['with_validation'] += 1
         
-        if any(kw in combined for kw in ranking_keywords) and not has_ranking:
-            issues['potential_ranking_candidates'].append({
-                'qid': qid,
-                'title': q.get('title', ''),
-                'type': q_type
-            })
-    
-    def _check_long_prompts(self, qid: str, q: Dict, issues: Dict) -> None:
-        """Check for prompts exceeding 200 characters."""
-        prompt = q.get('prompt', '')
-        if len(prompt) > 200:
-            issues['long_prompts'].append({
-                'qid': qid,
-                'title': q.get('title', ''),
-                'length': len(prompt)
-            })
-    
-    def _check_options(self, qid: str, q: Dict, q_type: str, issues: Dict) -> None:
-        """Review options for select-type questions."""
-        if q_type in ['single_select', 'multi_select']:
-            options = q.get('options', [])
-            if not options:
-                issues['questions_without_options'].append({
-                    'qid': qid,
-                    'title': q.get('title', ''),
-                    'type': q_type
-                })
-    
-    def _check_compound_fields(self, qid: str, q: Dict, q_type: str, issues: Dict) -> None:
-        """Analyze compound question fields."""
-        if q_type == 'compound':
-            fields = q.get('fields', [])
-            if not fields:
-                issues['compound_without_fields'].append({
-                    'qid': qid,
-                    'title': q.get('title', '')
-                })
+        # Multi-select questions without max limits
+        if check_limits and q_type == 'multi_select':
+            if not (validation or {}).get('max_selected'):
+                issues['multi_select_no_limit'].append((qid, title))
+        
+        # Questions that might benefit from ranking
+        if check_ranking and (prompt or title):
+            mentions_ranking = self.RANKING_RE.search(prompt) or self.RANKING_RE.search(title)
+            # Only scan compound fields for a ranked_select when the text suggests ranking
+            if mentions_ranking and not any(f.get('type') == 'ranked_select' for f in fields):
+                issues['potential_ranking_candidates'].append((qid, title, q_type))
+        
+        # Prompts exceeding 200 characters
+        if check_prompts and len(prompt) > 200:
+            issues['long_prompts'].append((qid, title, len(prompt)))
+        
+        # Select-type questions without options
+        if check_options and q_type in ('single_select', 'multi_select'):
+            if not q.get('options', []):
+                issues['questions_without_options'].append((qid, title, q_type))
+        
+        # Compound questions without fields
+        if check_compound and is_compound and not fields:
+            issues['compound_without_fields'].append((qid, title))
     
     def format_text(self, results: List[Dict]) -> str:
         """Format audit results as text."""
-        lines = []
-        lines.append("=" * 70)
-        lines.append(" QUESTION AUDIT REPORT - Ready for Us PWA")
-        lines.append("=" * 70)
-        lines.append("")
+        return "\n".join(self._iter_text_lines(results))
+    
+    def _iter_text_lines(self, results: List[Dict]) -> Iterator[str]:
+        """Yield report lines; joined once by the caller."""
+        yield SEPARATOR
+        yield " QUESTION AUDIT REPORT - Ready for Us PWA"
+        yield SEPARATOR
+        yield ""
         
         for result in results:
             if 'error' in result:
-                lines.append(f"\n[ERROR] {result['phase']}: {result['error']}")
+                yield f"\n[ERROR] {result['phase']}: {result['error']}"
                 continue
             
-            lines.append("=" * 70)
-            lines.append(f" {result['phase_title']} ({result['phase']})")
-            lines.append("=" * 70)
+            yield SEPARATOR
+            yield f" {result['phase_title']} ({result['phase']})"
+            yield SEPARATOR
             
             # Statistics
             stats = result['stats']
-            lines.append("\n[STATISTICS]")
-            lines.append(f"  Total questions: {stats['total']}")
-            lines.append(f"  Lite mode: {stats['lite_count']}")
-            lines.append(f"  Full-only: {stats['full_only_count']}")
+            total = stats['total']
+            with_examples = stats['with_examples']
+            yield "\n[STATISTICS]"
+            yield f"  Total questions: {total}"
+            yield f"  Lite mode: {stats['lite_count']}"
+            yield f"  Full-only: {stats['full_only_count']}"
             
-            if stats['total'] > 0:
-                example_pct = (stats['with_examples'] * 100) // stats['total']
-                lines.append(f"  With examples: {stats['with_examples']} ({example_pct}%)")
-                lines.append(f"  With validation: {stats['with_validation']}")
+            if total > 0:
+                example_pct = (with_examples * 100) // total
+                yield f"  With examples: {with_examples} ({example_pct}%)"
+                yield f"  With validation: {stats['with_validation']}"
             
-            lines.append("\n  By type:")
+            yield "\n  By type:"
             for q_type, count in sorted(stats['by_type'].items()):
-                lines.append(f"    {q_type}: {count}")
+                yield f"    {q_type}: {count}"
             
             # Issues
             issues = result['issues']
-            lines.append("\n[ISSUES FOUND]")
+            yield "\n[ISSUES FOUND]"
             
-            if not any(issues.values()):
-                lines.append("  No issues found!")
+            non_empty = [(k, v) for k, v in issues.items() if v]
+            if not non_empty:
+                yield "  No issues found!"
             
-            for issue_type, issue_list in issues.items():
-                if not issue_list:
-                    continue
-                
+            for issue_type, issue_list in non_empty:
                 title = issue_type.replace('_', ' ').title()
-                lines.append(f"\n  {title} ({len(issue_list)}):")
+                yield f"\n  {title} ({len(issue_list)}):"
                 
+                extra = self.ISSUE_FIELDS.get(issue_type, self.DEFAULT_ISSUE_FIELDS)[2:]
                 for item in issue_list[:10]:  # Limit to 10 items
-                    if 'length' in item:
-                        lines.append(f"    {item['qid']}: {item['title']} ({item['length']} chars)")
-                    elif 'type' in item:
-                        lines.append(f"    {item['qid']} [{item['type']}]: {item['title']}")
+                    if extra == ('length',):
+                        yield f"    {item[0]}: {item[1]} ({item[2]} chars)"
+                    elif extra == ('type',):
+                        yield f"    {item[0]} [{item[2]}]: {item[1]}"
                     else:
-                        lines.append(f"    {item['qid']}: {item['title']}")
+                        yield f"    {item[0]}: {item[1]}"
                 
                 if len(issue_list) > 10:
-                    lines.append(f"    ... and {len(issue_list) - 10} more")
+                    yield f"    ... and {len(issue_list) - 10} more"
             
-            lines.append("")
-        
-        lines.append("=" * 70)
-        lines.append(" END OF REPORT")
-        lines.append("=" * 70)
+            yield ""
         
-        return "\n".join(lines)
+        yield SEPARATOR
+        yield " END OF REPORT"
+        yield SEPARATOR
     
     def format_json(self, results: List[Dict]) -> str:
         """Format audit results as JSON."""
-        return json.dumps(results, indent=2, ensure_ascii=False)
+        return json.dumps(self._json_results(results), indent=2, ensure_ascii=False)
+    
+    def write_json(self, results: List[Dict], stream: TextIO) -> None:
+        """Stream audit results as JSON into an open text file."""
+        json.dump(self._json_results(results), stream, indent=2, ensure_ascii=False)
+    
+    def _json_results(self, results: List[Dict]) -> List[Dict]:
+        """Expand issue tuples back into keyed objects for a self-describing report."""
+        expanded = []
+        for result in results:
+            issues = {
+                issue_type: [
+                    dict(zip(self.ISSUE_FIELDS.get(issue_type, self.DEFAULT_ISSUE_FIELDS), item))
+                    for item in issue_list
+                ]
+                for issue_type, issue_list in result.get('issues', {}).items()
+                if issue_list
+            }
+            expanded.append({**result, 'issues': issues})
+        return expanded
     
     def format_markdown(self, results: List[Dict]) -> str:
         """Format audit results as Markdown."""
-        lines = []
-        lines.append("# Question Audit Report - Ready for Us PWA\n")
+        return "\n".join(self._iter_markdown_lines(results))
+    
+    def _iter_markdown_lines(self, results: List[Dict]) -> Iterator[str]:
+        """Yield report lines; joined once by the caller."""
+        yield "# Question Audit Report - Ready for Us PWA\n"
         
         for result in results:
             if 'error' in result:
-                lines.append(f"## {result['phase']}\n")
-                lines.append(f"**Error**: {result['error']}\n")
+                yield f"## {result['phase']}\n"
+                yield f"**Error**: {result['error']}\n"
                 continue
             
-            lines.append(f"## {result['phase_title']} ({result['phase']})\n")
+            yield f"## {result['phase_title']} ({result['phase']})\n"
             
             # Statistics
             stats = result['stats']
-            lines.append("### Statistics\n")
-            lines.append(f"- **Total questions**: {stats['total']}")
-            lines.append(f"- **Lite mode**: {stats['lite_count']}")
-            lines.append(f"- **Full-only**: {stats['full_only_count']}")
+            total = stats['total']
+            with_examples = stats['with_examples']
+            yield "### Statistics\n"
+            yield f"- **Total questions**: {total}"
+            yield f"- **Lite mode**: {stats['lite_count']}"
+            yield f"- **Full-only**: {stats['full_only_count']}"
             
-            if stats['total'] > 0:
-                example_pct = (stats['with_examples'] * 100) // stats['total']
-                lines.append(f"- **With examples**: {stats['with_examples']} ({example_pct}%)")
-                lines.append(f"- **With validation**: {stats['with_validation']}")
+            if total > 0:
+                example_pct = (with_examples * 100) // total
+                yield f"- **With examples**: {with_examples} ({example_pct}%)"
+                yield f"- **With validation**: {stats['with_validation']}"
             
-            lines.append("\n**By type:**\n")
+            yield "\n**By type:**\n"
             for q_type, count in sorted(stats['by_type'].items()):
-                lines.append(f"- `{q_type}`: {count}")
+                yield f"- `{q_type}`: {count}"
             
             # Issues
             issues = result['issues']
-            lines.append("\n### Issues Found\n")
+            yield "\n### Issues Found\n"
             
-            if not any(issues.values()):
-                lines.append("✓ No issues found!\n")
+            non_empty = [(k, v) for k, v in issues.items() if v]
+            if not non_empty:
+                yield "✓ No issues found!\n"
             
-            for issue_type, issue_list in issues.items():
-                if not issue_list:
-                    continue
-                
+            for issue_type, issue_list in non_empty:
                 title = issue_type.replace('_', ' ').title()
-                lines.append(f"#### {title} ({len(issue_list)})\n")
+                yield f"#### {title} ({len(issue_list)})\n"
                 
+                extra = self.ISSUE_FIELDS.get(issue_type, self.DEFAULT_ISSUE_FIELDS)[2:]
                 for item in issue_list[:10]:
-                    if 'length' in item:
-                        lines.append(f"- `{item['qid']}`: {item['title']} ({item['length']} chars)")
-                    elif 'type' in item:
-                        lines.append(f"- `{item['qid']}` [{item['type']}]: {item['title']}")
+                    if extra == ('length',):
+                        yield f"- `{item[0]}`: {item[1]} ({item[2]} chars)"
+                    elif extra == ('type',):
+                        yield f"- `{item[0]}` [{item[2]}]: {item[1]}"
                     else:
-                        lines.append(f"- `{item['qid']}`: {item['title']}")
+                        yield f"- `{item[0]}`: {item[1]}"
                 
                 if len(issue_list) > 10:
-                    lines.append(f"\n*... and {len(issue_list) - 10} more*\n")
+                    yield f"\n*... and {len(issue_list) - 10} more*\n"
                 
-                lines.append("")
-        
-        lines.append("---\n")
-        lines.append("*Report generated by audit_questions.py*\n")
+                yield ""
         
-        return "\n".join(lines)
+        yield "---\n"
+        yield "*Report generated by audit_questions.py*\n"
 
 
 def main():
@@ -485,14 +486,15 @@ Examples:
             print("[ERROR] No phases found in data/ directory", file=sys.stderr)
             sys.exit(1)
     
-    # Run audit
-    results = []
-    for phase in phases:
-        result = auditor.audit_phase(phase)
-        results.append(result)
+    # Run audit in-process: each phase takes a few milliseconds, so worker
+    # processes would cost more to start than they save
+    results = [auditor.audit_phase(phase) for phase in phases]
     
-    # Format output
-    if args.format == 'json':
+    # Format output (a JSON report going to a file is streamed below instead)
+    stream_json = args.format == 'json' and args.output
+    if stream_json:
+        output = None
+    elif args.format == 'json':
         output = auditor.format_json(results)
     elif args.format == 'markdown':
         output = auditor.format_markdown(results)
@@ -503,7 +505,10 @@ Examples:
     if args.output:
         output_path = Path(args.output)
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(output)
+            if stream_json:
+                auditor.write_json(results, f)
+            else:
+                f.write(output)
         print(f"[SUCCESS] Audit report saved to: {output_path}", file=sys.stderr)
     else:
         print(output)
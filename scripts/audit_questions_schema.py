@@ -24,7 +24,6 @@ Operational Notes:
 """
 
 import json
-import glob
 import os
 import sys
 from typing import Dict, List, Any, Set, Optional
@@ -36,12 +35,19 @@ YELLOW = "\033[93m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+# Colored output lines, formatted once at import and filled with %
+LOAD_ERROR_LINE = f"{RED}Error loading %s: %s{RESET}"
+CHECK_OK_LINE = f"Checking {BOLD}%s{RESET}... {GREEN}OK{RESET}\n"
+CHECK_FAIL_LINE = f"Checking {BOLD}%s{RESET}... {RED}FAIL{RESET}\n"
+SUCCESS_LINE = f"{GREEN}SUCCESS: All %d files match the schema.{RESET}"
+FAILURE_LINE = f"{RED}FAILURE: Found %d errors in %d files.{RESET}"
+
 def load_json(path: str) -> Optional[Dict[str, Any]]:
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            return json.loads(f.read())
     except Exception as e:
-        print(f"{RED}Error loading {path}: {e}{RESET}")
+        print(LOAD_ERROR_LINE % (path, e))
         return None
 
 def validate_integrity(data: Dict[str, Any], context: str) -> List[str]:
@@ -83,57 +89,75 @@ def validate_integrity(data: Dict[str, Any], context: str) -> List[str]:
 
     return errors
 
+# Validators take schema=None when answer_schema is missing: question-level checks still run,
+# answer_schema key checks are skipped (the missing field is already reported)
+def _validate_single_select(q: Dict[str, Any], schema: Optional[Dict[str, Any]], prefix: str, errors: List[str]) -> None:
+    if "options" not in q:
+        errors.append(f"{prefix}: Missing 'options' for single_select")
+    if schema is not None and "selected_value" not in schema:
+        errors.append(f"{prefix}.answer_schema: Missing 'selected_value'")
+
+def _validate_multi_select(q: Dict[str, Any], schema: Optional[Dict[str, Any]], prefix: str, errors: List[str]) -> None:
+    if "options" not in q:
+        errors.append(f"{prefix}: Missing 'options' for multi_select")
+    if schema is not None and "selected_values" not in schema:
+        errors.append(f"{prefix}.answer_schema: Missing 'selected_values'")
+
+def _validate_compound(q: Dict[str, Any], schema: Optional[Dict[str, Any]], prefix: str, errors: List[str]) -> None:
+    if "fields" not in q:
+        errors.append(f"{prefix}: Missing 'fields' for compound question")
+        return
+    if schema is None:
+        return
+
+    # Check that answer_schema has keys for all fields
+    field_keys = {f["key"] for f in q["fields"] if "key" in f}
+    schema_keys = set(schema.keys())
+    
+    # Note: explicit check - are all fields represented?
+    # We allow extra keys (like 'notes' or 'other_text' if generic), 
+    # but usually compound schema keys match field keys exactly.
+    
+    # Exception: 'notes' might be common but not a field? 
+    # Actually for compound, typically every schema key comes from a field 
+    # OR generic 'notes' if defined.
+    
+    missing_schema_keys = field_keys - schema_keys
+    if missing_schema_keys:
+         errors.append(f"{prefix}.answer_schema: Missing keys for fields: {missing_schema_keys}")
+
+def _validate_free_text(q: Dict[str, Any], schema: Optional[Dict[str, Any]], prefix: str, errors: List[str]) -> None:
+    if schema is not None and "text" not in schema:
+         errors.append(f"{prefix}.answer_schema: Missing 'text'")
+
+REQUIRED_QUESTION_FIELDS = ("id", "type", "title", "prompt", "answer_schema")
+REQUIRED_QUESTION_FIELD_SET = frozenset(REQUIRED_QUESTION_FIELDS)
+
+# Type-specific validators, looked up once per question
+TYPE_VALIDATORS = {
+    "single_select": _validate_single_select,
+    "multi_select": _validate_multi_select,
+    "compound": _validate_compound,
+    "free_text": _validate_free_text,
+}
+
 def validate_question_schema(qid: str, q: Dict[str, Any], context: str) -> List[str]:
     errors = []
     prefix = f"{context}.questions[{qid}]"
     
     # Check required base fields
-    for field in ["id", "type", "title", "prompt", "answer_schema"]:
-        if field not in q:
-            errors.append(f"{prefix}: Missing required field '{field}'")
-            
-    if "type" not in q:
-        return errors # logical stop
+    if not REQUIRED_QUESTION_FIELD_SET <= q.keys():
+        for field in REQUIRED_QUESTION_FIELDS:
+            if field not in q:
+                errors.append(f"{prefix}: Missing required field '{field}'")
+        if "type" not in q:
+            return errors # logical stop
         
-    qtype = q["type"]
-    schema = q.get("answer_schema", {})
-    
     # Type-specific validation
-    if qtype == "single_select":
-        if "options" not in q:
-            errors.append(f"{prefix}: Missing 'options' for single_select")
-        if "selected_value" not in schema:
-            errors.append(f"{prefix}.answer_schema: Missing 'selected_value'")
-            
-    elif qtype == "multi_select":
-        if "options" not in q:
-            errors.append(f"{prefix}: Missing 'options' for multi_select")
-        if "selected_values" not in schema:
-             errors.append(f"{prefix}.answer_schema: Missing 'selected_values'")
-             
-    elif qtype == "compound":
-        if "fields" not in q:
-            errors.append(f"{prefix}: Missing 'fields' for compound question")
-        else:
-            # Check that answer_schema has keys for all fields
-            field_keys = {f["key"] for f in q["fields"] if "key" in f}
-            schema_keys = set(schema.keys())
-            
-            # Note: explicit check - are all fields represented?
-            # We allow extra keys (like 'notes' or 'other_text' if generic), 
-            # but usually compound schema keys match field keys exactly.
-            
-            # Exception: 'notes' might be common but not a field? 
-            # Actually for compound, typically every schema key comes from a field 
-            # OR generic 'notes' if defined.
-            
-            missing_schema_keys = field_keys - schema_keys
-            if missing_schema_keys:
-                 errors.append(f"{prefix}.answer_schema: Missing keys for fields: {missing_schema_keys}")
-
-    elif qtype == "free_text":
-        if "text" not in schema:
-             errors.append(f"{prefix}.answer_schema: Missing 'text'")
+    qtype = q["type"]
+    validator = TYPE_VALIDATORS.get(qtype) if isinstance(qtype, str) else None
+    if validator:
+        validator(q, q.get("answer_schema"), prefix, errors)
              
     # Check for 'notes' key consistency
     # (If using notes, usually it's in answer_schema, code typically handles it if present)
@@ -169,9 +193,14 @@ def main():
         print(f"{RED}Error: Data directory not found{RESET}")
         sys.exit(1)
         
-    pattern = os.path.join(base_dir, "phase_*", "questions.json")
-    files = glob.glob(pattern)
-    files.sort()
+    # Single directory pass; DirEntry caches the file type
+    with os.scandir(base_dir) as entries:
+        files = sorted(
+            os.path.join(entry.path, "questions.json")
+            for entry in entries
+            if entry.name.startswith("phase_") and entry.is_dir()
+            and os.path.isfile(os.path.join(entry.path, "questions.json"))
+        )
     
     if not files:
         print(f"{YELLOW}No phase_*/questions.json files found.{RESET}")
@@ -182,26 +211,25 @@ def main():
 
     for file_path in files:
         rel_path = os.path.relpath(file_path, os.path.dirname(os.path.dirname(__file__)))
-        print(f"Checking {BOLD}{rel_path}{RESET}...", end=" ")
-        
         file_errors = audit_file(file_path)
         
         if not file_errors:
-            print(f"{GREEN}OK{RESET}")
+            sys.stdout.write(CHECK_OK_LINE % rel_path)
         else:
-            print(f"{RED}FAIL{RESET}")
             files_with_errors += 1
-            for err in file_errors:
-                print(f"  - {err}")
-                total_errors += 1
-            print("")
+            total_errors += len(file_errors)
+            # One write per file instead of one print per error
+            out = [CHECK_FAIL_LINE % rel_path]
+            out.extend(f"  - {err}\n" for err in file_errors)
+            out.append("\n")
+            sys.stdout.write("".join(out))
 
     print("-" * 40)
     if total_errors == 0:
-        print(f"{GREEN}SUCCESS: All {len(files)} files match the schema.{RESET}")
+        print(SUCCESS_LINE % len(files))
         sys.exit(0)
     else:
-        print(f"{RED}FAILURE: Found {total_errors} errors in {files_with_errors} files.{RESET}")
+        print(FAILURE_LINE % (total_errors, files_with_errors))
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -17,17 +17,97 @@ Files Updated:
     - js/data-loader.js (CACHE_VERSION)
     - js/sw.js (CACHE_NAME, STATIC_ASSETS)
     - index.html (CSS/JS links)
+
+Re-runs with the same version skip files whose size and mtime match the
+.bump_version_cache.json sidecar written to the project root.
 """
 
 import sys
 import re
 import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+# Patterns are compiled once at import instead of on every lookup inside the update loop
+VERSION_RE = re.compile(r'^\d+\.\d+\.\d+$')
+CACHE_VERSION_RE = re.compile(r"(CACHE_VERSION:\s*['\"])([\d\.]+)(['\"])")
+SW_CACHE_NAME_RE = re.compile(r"(const CACHE_NAME = 'readyforus-v)([\d\.]+)(['\"];)")
+ASSET_QUERY_RE = re.compile(r"(\?v=)([\d\.]+)(['\"])")  # Matches ?v=x.y.z in asset lists and link/script tags
+DASHBOARD_FALLBACK_RE = re.compile(r"(const v = DataLoader\.CACHE_VERSION \|\| ')([\d\.]+)(['\"];)")
+AI_PROMPTS_FALLBACK_RE = re.compile(r"(const version = DataLoader\.CACHE_VERSION \|\| ')([\d\.]+)(['\"];)")
+
+# Sidecar cache in the project root: path -> [mtime_ns, size, version] for files already bumped
+CACHE_FILENAME = '.bump_version_cache.json'
+
+def load_cache(cache_path):
+    """Loads the sidecar cache, or an empty one if it is missing or unreadable."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_cache(cache_path, cache):
+    """Writes the sidecar cache; failures only cost a re-read on the next run."""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"[WARNING] Could not save version cache: {e}")
+
+def update_file(project_root, rel_path, updates, new_version, cached):
+    """Applies every version pattern for one file.
+
+    Returns the report text and, when every pattern is now at the new version,
+    the [mtime_ns, size, version] entry to remember in the sidecar cache.
+    """
+    file_path = os.path.join(project_root, rel_path)
+    
+    try:
+        # Files untouched since they were bumped to this version can be skipped on a stat alone
+        st = os.stat(file_path)
+        if cached == [st.st_mtime_ns, st.st_size, new_version]:
+            return "\n".join(f"[SKIPPED] No changes needed for {file_info['desc']} in {rel_path}" for file_info in updates), None
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            original = f.read()
+        
+        content = original
+        messages = []
+        all_found = True
+        for file_info in updates:
+            # Check if file needs update; one scan collects the versions currently in place,
+            # and the substitution only runs when some of them differ from the new one
+            found_versions = {m.group(2) for m in file_info['pattern'].finditer(content)}
+            if not found_versions:
+                all_found = False
+                messages.append(f"[WARNING] Pattern not found for {file_info['desc']} in {rel_path}")
+            elif found_versions == {new_version}:
+                messages.append(f"[SKIPPED] No changes needed for {file_info['desc']} in {rel_path}")
+            else:
+                content = file_info['pattern'].sub(file_info['replacement'], content)
+                messages.append(f"[UPDATED] {file_info['desc']} in {rel_path}")
+
+        if content != original:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+        # Only remember files where every pattern is now at the new version
+        cache_entry = None
+        if all_found:
+            st = os.stat(file_path)
+            cache_entry = [st.st_mtime_ns, st.st_size, new_version]
+        return "\n".join(messages), cache_entry
+
+    except Exception as e:
+        return f"[ERROR] Failed to update {rel_path}: {e}", None
 
 def bump_version(new_version):
     """Updates version strings in all target files."""
     
     # validating version format (simple x.y.z)
-    if not re.match(r'^\d+\.\d+\.\d+$', new_version):
+    if not VERSION_RE.match(new_version):
         print(f"Error: Invalid version format '{new_version}'. Expected format: x.y.z (e.g., 2.4.0)")
         sys.exit(1)
 
@@ -37,70 +117,73 @@ def bump_version(new_version):
     files_to_update = [
         {
             'path': 'js/html-loader.js',
-            'pattern': r"(CACHE_VERSION:\s*['\"])([\d\.]+)(['\"])",
+            'pattern': CACHE_VERSION_RE,
             'replacement': f"\\g<1>{new_version}\\g<3>",
             'desc': 'HTML Loader CACHE_VERSION'
         },
         {
             'path': 'js/data-loader.js',
-            'pattern': r"(CACHE_VERSION:\s*['\"])([\d\.]+)(['\"])",
+            'pattern': CACHE_VERSION_RE,
             'replacement': f"\\g<1>{new_version}\\g<3>",
             'desc': 'Data Loader CACHE_VERSION'
         },
         {
             'path': 'js/sw.js',
-            'pattern': r"(const CACHE_NAME = 'readyforus-v)([\d\.]+)(['\"];)",
+            'pattern': SW_CACHE_NAME_RE,
             'replacement': f"\\g<1>{new_version}\\g<3>",
             'desc': 'Service Worker CACHE_NAME'
         },
         {
             'path': 'js/sw.js',
-            'pattern': r"(\?v=)([\d\.]+)(['\"])",  # Matches ?v=x.y.z in asset list
+            'pattern': ASSET_QUERY_RE,
             'replacement': f"\\g<1>{new_version}\\g<3>",
             'desc': 'Service Worker Assets'
         },
         {
             'path': 'index.html',
-            'pattern': r"(\?v=)([\d\.]+)([\"'])", # Matches ?v=x.y.z in link/script tags
+            'pattern': ASSET_QUERY_RE,
             'replacement': f"\\g<1>{new_version}\\g<3>",
             'desc': 'Index HTML Assets'
         },
         {
             'path': 'js/app/dashboard.js',
-            'pattern': r"(const v = DataLoader\.CACHE_VERSION \|\| ')([\d\.]+)(['\"];)",
+            'pattern': DASHBOARD_FALLBACK_RE,
             'replacement': f"\\g<1>{new_version}\\g<3>",
             'desc': 'Dashboard JS Fallback Version'
         },
         {
             'path': 'js/app/ai-prompts.js',
-            'pattern': r"(const version = DataLoader\.CACHE_VERSION \|\| ')([\d\.]+)(['\"];)",
+            'pattern': AI_PROMPTS_FALLBACK_RE,
             'replacement': f"\\g<1>{new_version}\\g<3>",
             'desc': 'AI Prompts JS Fallback Version'
         }
     ]
 
+    # Group updates by file so each file is read and written once, whatever the number of patterns
+    updates_by_path = {}
     for file_info in files_to_update:
-        file_path = os.path.join(project_root, file_info['path'])
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check if file needs update
-            if re.search(file_info['pattern'], content):
-                new_content = re.sub(file_info['pattern'], file_info['replacement'], content)
-                
-                if new_content != content:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(new_content)
-                    print(f"[UPDATED] {file_info['desc']} in {file_info['path']}")
-                else:
-                    print(f"[SKIPPED] No changes needed for {file_info['desc']} in {file_info['path']}")
-            else:
-                 print(f"[WARNING] Pattern not found for {file_info['desc']} in {file_info['path']}")
+        updates_by_path.setdefault(file_info['path'], []).append(file_info)
+
+    cache_path = os.path.join(project_root, CACHE_FILENAME)
+    cache = load_cache(cache_path)
+    cache_changed = False
+
+    # Files are independent, so they are read, patched and written concurrently;
+    # reports are printed afterwards in the original file order
+    with ThreadPoolExecutor(max_workers=min(8, len(updates_by_path))) as executor:
+        reports = list(executor.map(
+            lambda rel_path: update_file(project_root, rel_path, updates_by_path[rel_path], new_version, cache.get(rel_path)),
+            updates_by_path
+        ))
+
+    for rel_path, (report, cache_entry) in zip(updates_by_path, reports):
+        print(report)
+        if cache_entry is not None:
+            cache[rel_path] = cache_entry
+            cache_changed = True
 
-        except Exception as e:
-            print(f"[ERROR] Failed to update {file_info['path']}: {e}")
+    if cache_changed:
+        save_cache(cache_path, cache)
 
     print("\nVersion bump complete! Don't forget to commit your changes.")
 
@@ -1,11 +1,31 @@
 import json
 import os
+from pathlib import Path
 
 phases = ['phase_0', 'phase_1', 'phase_1.5', 'phase_2', 'phase_2.5']
 base_dir = r'c:\Users\Roy\Desktop\AI\Slow-Build-Check-In\data'
 
 def load_json(path):
-    with open(path, 'r', encoding='utf-8') as f: return json.load(f)
+    return json.loads(Path(path).read_bytes())
+
+def load_json_or_none(path):
+    # One open/read instead of an exists() check followed by the load
+    try: return json.loads(Path(path).read_bytes())
+    except FileNotFoundError: return None
+
+MISSING = object()
+
+def diff(ref, other):
+    """Yield (key_path, ref_value, other_value) for each differing leaf, walking nested dicts iteratively."""
+    stack = [((), ref, other)]
+    while stack:
+        key_path, a, b = stack.pop()
+        if isinstance(a, dict) and isinstance(b, dict):
+            children = [(key_path + (k,), a[k], b.get(k, MISSING)) for k in a]
+            children += [(key_path + (k,), MISSING, b[k]) for k in b if k not in a]
+            stack.extend(reversed(children))
+        elif a != b:
+            yield key_path, a, b
 
 ref_manifest = load_json(os.path.join(base_dir, 'phase_1', 'phase_1_manifest_schema.json'))
 
@@ -14,29 +34,25 @@ results.append("Reference: phase_1_manifest_schema.json")
 
 for p in phases:
     path = os.path.join(base_dir, p, f'{p}_manifest_schema.json')
-    if not os.path.exists(path):
+    data = load_json_or_none(path)
+    if data is None:
         results.append(f"{p}: MISSING")
         continue
 
-    data = load_json(path)
-    if data == ref_manifest:
+    # Single walk over both manifests; an empty diff means they match
+    diffs = list(diff(ref_manifest, data))
+    if not diffs:
         results.append(f"{p}: MATCH")
     else:
         results.append(f"{p}: MISMATCH")
-        # specific diffs
-        for k in ref_manifest:
-            if k not in data:
-                results.append(f"  - Missing key in {p}: {k}")
-            elif data[k] != ref_manifest[k]:
-                results.append(f"  - Mismatch value in {p} for key: {k}")
-                # simple recursive print for intro if that's the issue
-                if isinstance(data[k], dict) and isinstance(ref_manifest[k], dict):
-                     if data[k] != ref_manifest[k]:
-                         results.append(f"    - Deep diff in {k}: {data[k]} vs {ref_manifest[k]}")
-
-        for k in data:
-            if k not in ref_manifest:
-                results.append(f"  - Extra key in {p}: {k}")
-
-with open('schema_manifest_check_results.txt', 'w') as f:
-    f.write('\n'.join(results))
+        # specific diffs, one line per differing path
+        for key_path, ref_value, value in diffs:
+            key = '.'.join(key_path)
+            if value is MISSING:
+                results.append(f"  - Missing key in {p}: {key}")
+            elif ref_value is MISSING:
+                results.append(f"  - Extra key in {p}: {key}")
+            else:
+                results.append(f"  - Mismatch value in {p} for key: {key} ({value!r} vs {ref_value!r})")
+
+Path('schema_manifest_check_results.txt').write_text('\n'.join(results), encoding='utf-8')
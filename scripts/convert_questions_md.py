@@ -22,11 +22,76 @@ import json
 import re
 from pathlib import Path
 
+# Section and question headers share one alternation, scanned over the whole file at once.
+# [^\S\n] is whitespace that stays on the header's own line.
+HEADER_RE = re.compile(
+    r'^(?:## Section (?P<section_num>\d+):[^\S\n]*(?P<section_title>.+)'
+    r'|### Q(?P<q_num>\d+)[^\S\n]*\[(?P<mode>LITE|FULL)\][^\S\n]*—[^\S\n]*(?P<q_title>.+))$',
+    re.MULTILINE
+)
+
+# Patterns used while parsing question blocks, compiled once at import
+OPTION_LIST_RE = re.compile(r'^- `([^`]+)`:\s*["\']?([^"\']+)["\']?')
+OPTION_LINE_RE = re.compile(r'-\s*`([^`]+)`:\s*["\']?(.+?)["\']?$')
+FIELD_DEF_RE = re.compile(r'\d+\.\s+`([^`]+)`\s+\(([^)]+)\)(?::\s*["\']([^"\']+)["\'])?')
+FIELD_LINE_RE = re.compile(r'\d+\.\s*`([^`]+)`\s*\(([^)]+)\)(?::\s*["\']?([^"\']+)["\']?)?')
+# Single-quoted labels run to the last quote so apostrophes inside them survive
+FIELD_QUOTED_RE = re.compile(r'^\d+\.\s*`([^`]+)`\s*\(([^)]+)\)(?::\s*(?:"([^"]+)"|\'(.+)\'))?')
+NUMBERED_LINE_RE = re.compile(r'^\d+\.')
+MAX_SELECTED_RE = re.compile(r'max\s*(\d+)')
+NUMBER_RANGE_RE = re.compile(r'(\d+)-(\d+)')
+SHOW_WHEN_RE = re.compile(r'showWhen\s+(\w+)')
+QUESTION_NUM_RE = re.compile(r'Q(\d+)')
+HEADER_TITLE_RE = re.compile(r'—\s*(.+)$')
+TYPE_RE = re.compile(r'\*\*Type\*\*:\s*(\w+)')
+PROMPT_RE = re.compile(r'\*\*Prompt\*\*:\s*["\']?(.+?)["\']?\s*$', re.MULTILINE)
+
+WRITE_BUFFER_SIZE = 1 << 17  # 128 KiB
+
+# Field types in match priority; the first one found among the type info's words wins.
+# Matching is by whole word (\w+, so underscores join words): '(number_range)' is short_text, not number.
+FIELD_TYPES = ('ranked_select', 'multi_select', 'single_select', 'number', 'free_text', 'short_text')
+TYPE_WORD_RE = re.compile(r'\w+')
+
+def _build_field(key: str, label: str, type_info: str) -> dict:
+    """Build a field from its key, label and `(type, constraints)` text"""
+    field = {"key": key, "label": label, "type": "short_text"}
+    
+    type_info_lower = type_info.lower()
+    type_words = set(TYPE_WORD_RE.findall(type_info_lower))
+    for field_type in FIELD_TYPES:
+        if field_type in type_words:
+            field["type"] = field_type
+            break
+    
+    if field["type"] == "number":
+        range_match = NUMBER_RANGE_RE.search(type_info)
+        if range_match:
+            field["min"] = int(range_match.group(1))
+            field["max"] = int(range_match.group(2))
+    
+    if 'optional' in type_info_lower:
+        field["placeholder"] = "Optional"
+    
+    # Check for max selections
+    if field["type"] in ("multi_select", "ranked_select"):
+        max_match = MAX_SELECTED_RE.search(type_info_lower)
+        if max_match:
+            field["validation"] = {"max_selected": int(max_match.group(1))}
+    
+    # Check for showWhen
+    if 'showWhen' in type_info:
+        show_match = SHOW_WHEN_RE.search(type_info)
+        if show_match:
+            field["showWhen"] = {"field": show_match.group(1), "equals": show_match.group(1)}
+    
+    return field
+
 def parse_options(lines: list[str]) -> list[dict]:
     """Parse option lines like `- `value`: "Label text"`"""
     options = []
     for line in lines:
-        match = re.match(r'^- `([^`]+)`:\s*["\']?([^"\']+)["\']?', line.strip())
+        match = OPTION_LIST_RE.match(line.strip())
         if match:
             options.append({"value": match.group(1), "label": match.group(2).strip('"\'')})
     return options
@@ -34,52 +99,10 @@ def parse_options(lines: list[str]) -> list[dict]:
 def parse_fields(content: str) -> list[dict]:
     """Parse compound field definitions"""
     fields = []
-    field_pattern = r'\d+\.\s+`([^`]+)`\s+\(([^)]+)\)(?::\s*["\']([^"\']+)["\'])?'
-    
-    for match in re.finditer(field_pattern, content):
+    for match in FIELD_DEF_RE.finditer(content):
         key = match.group(1)
-        type_info = match.group(2)
         label = match.group(3) or key.replace('_', ' ').title()
-        
-        field = {"key": key, "label": label}
-        
-        # Parse type
-        if 'ranked_select' in type_info:
-            field["type"] = "ranked_select"
-            max_match = re.search(r'max\s*(\d+)', type_info)
-            if max_match:
-                field["validation"] = {"max_selected": int(max_match.group(1))}
-        elif 'multi_select' in type_info:
-            field["type"] = "multi_select"
-            max_match = re.search(r'max\s*(\d+)', type_info)
-            if max_match:
-                field["validation"] = {"max_selected": int(max_match.group(1))}
-        elif 'single_select' in type_info:
-            field["type"] = "single_select"
-        elif 'number' in type_info:
-            field["type"] = "number"
-            range_match = re.search(r'(\d+)-(\d+)', type_info)
-            if range_match:
-                field["min"] = int(range_match.group(1))
-                field["max"] = int(range_match.group(2))
-        elif 'short_text' in type_info:
-            field["type"] = "short_text"
-        elif 'free_text' in type_info:
-            field["type"] = "free_text"
-        else:
-            field["type"] = "short_text"
-            
-        # Check for optional
-        if 'optional' in type_info.lower():
-            field["placeholder"] = "Optional"
-            
-        # Check for showWhen
-        if 'showWhen' in type_info:
-            show_match = re.search(r'showWhen\s+(\w+)', type_info)
-            if show_match:
-                field["showWhen"] = {"field": show_match.group(1), "equals": show_match.group(1)}
-        
-        fields.append(field)
+        fields.append(_build_field(key, label, match.group(2)))
     
     return fields
 
@@ -109,14 +132,14 @@ def parse_question_block(block: str, section_id: str, order: int) -> dict:
     
     # Extract question ID and mode from header
     header = lines[0] if lines else ""
-    id_match = re.search(r'Q(\d+)', header)
+    id_match = QUESTION_NUM_RE.search(header)
     q_id = f"q{id_match.group(1).zfill(2)}" if id_match else f"q{order:02d}"
     
     is_lite = "[LITE]" in header
     is_full = "[FULL]" in header
     
     # Extract title from header
-    title_match = re.search(r'—\s*(.+)$', header)
+    title_match = HEADER_TITLE_RE.search(header)
     title = title_match.group(1).strip() if title_match else ""
     
     question = {
@@ -141,11 +164,11 @@ def parse_question_block(block: str, section_id: str, order: int) -> dict:
         line_stripped = line.strip()
         
         if line_stripped.startswith("**Type**:"):
-            q_type = line_stripped.split(":")[-1].strip().lower()
+            q_type = line_stripped.rpartition(":")[2].strip().lower()
             question["type"] = q_type
             
         elif line_stripped.startswith("**Prompt**:"):
-            prompt = line_stripped.replace("**Prompt**:", "").strip().strip('"')
+            prompt = line_stripped[len("**Prompt**:"):].strip().strip('"')
             question["prompt"] = prompt
             
         elif line_stripped == "**Options**:":
@@ -158,11 +181,11 @@ def parse_question_block(block: str, section_id: str, order: int) -> dict:
             current_section = "examples"
             
         elif current_section == "options" and line_stripped.startswith("-"):
-            opt_match = re.match(r'-\s*`([^`]+)`:\s*["\']?(.+?)["\']?$', line_stripped)
+            opt_match = OPTION_LINE_RE.match(line_stripped)
             if opt_match:
                 options.append({"value": opt_match.group(1), "label": opt_match.group(2).strip('"\'')})
                 
-        elif current_section == "fields" and re.match(r'^\d+\.', line_stripped):
+        elif current_section == "fields" and NUMBERED_LINE_RE.match(line_stripped):
             field = parse_field_line(line_stripped)
             if field:
                 fields.append(field)
@@ -188,45 +211,13 @@ def parse_question_block(block: str, section_id: str, order: int) -> dict:
 def parse_field_line(line: str) -> dict:
     """Parse a field definition line"""
     # Pattern: 1. `key` (type, constraints): "Label"
-    match = re.match(r'\d+\.\s*`([^`]+)`\s*\(([^)]+)\)(?::\s*["\']?([^"\']+)["\']?)?', line)
+    match = FIELD_LINE_RE.match(line)
     if not match:
         return None
     
     key = match.group(1)
-    type_info = match.group(2)
     label = match.group(3) or key.replace('_', ' ').title()
-    
-    field = {"key": key, "label": label.strip('"\''), "type": "short_text"}
-    
-    type_info_lower = type_info.lower()
-    if 'ranked_select' in type_info_lower:
-        field["type"] = "ranked_select"
-    elif 'multi_select' in type_info_lower:
-        field["type"] = "multi_select"
-    elif 'single_select' in type_info_lower:
-        field["type"] = "single_select"
-    elif 'number' in type_info_lower:
-        field["type"] = "number"
-        range_match = re.search(r'(\d+)-(\d+)', type_info)
-        if range_match:
-            field["min"] = int(range_match.group(1))
-            field["max"] = int(range_match.group(2))
-    elif 'free_text' in type_info_lower:
-        field["type"] = "free_text"
-    elif 'short_text' in type_info_lower:
-        field["type"] = "short_text"
-    
-    if 'optional' in type_info_lower:
-        field["placeholder"] = "Optional"
-    
-    # Check for max selections
-    max_match = re.search(r'max\s*(\d+)', type_info_lower)
-    if max_match and field["type"] in ["multi_select", "ranked_select"]:
-        if "validation" not in field:
-            field["validation"] = {}
-        field["validation"]["max_selected"] = int(max_match.group(1))
-    
-    return field
+    return _build_field(key, label.strip('"\''), match.group(2))
 
 def parse_markdown(md_path: Path) -> dict:
     """Parse the entire questions.md file"""
@@ -237,20 +228,17 @@ def parse_markdown(md_path: Path) -> dict:
     lite_ids = []
     full_ids = []
     
-    # Split by section headers (## Section N:)
-    section_pattern = r'^## Section (\d+):\s*(.+)$'
-    question_pattern = r'^### (Q\d+)\s*\[(LITE|FULL)\]\s*—\s*(.+)$'
-    
     current_section = None
     current_section_id = None
     current_question_block = []
     order = 0
     
-    for line in content.split('\n'):
-        section_match = re.match(section_pattern, line)
-        question_match = re.match(question_pattern, line)
-        
-        if section_match:
+    # Split by section headers (## Section N:) and question headers (### QN [MODE] — Title);
+    # a question's block is the text between its header line and the next header
+    headers = list(HEADER_RE.finditer(content))
+    
+    for index, header_match in enumerate(headers):
+        if header_match.group("section_num") is not None:
             # Save previous question
             if current_question_block and current_section_id:
                 q = parse_question_content(current_question_block, current_section_id, order)
@@ -261,8 +249,8 @@ def parse_markdown(md_path: Path) -> dict:
                     full_ids.append(q["id"])
             current_question_block = []
             
-            section_num = section_match.group(1)
-            section_title = section_match.group(2).strip()
+            section_num = header_match.group("section_num")
+            section_title = header_match.group("section_title").strip()
             current_section_id = f"s{section_num}"
             sections.append({
                 "id": current_section_id,
@@ -270,7 +258,7 @@ def parse_markdown(md_path: Path) -> dict:
                 "question_ids": []
             })
             
-        elif question_match:
+        else:
             # Save previous question
             if current_question_block and current_section_id:
                 q = parse_question_content(current_question_block, current_section_id, order)
@@ -282,9 +270,10 @@ def parse_markdown(md_path: Path) -> dict:
                     full_ids.append(q["id"])
             
             order += 1
-            q_num = re.search(r'Q(\d+)', question_match.group(1)).group(1)
-            mode = question_match.group(2)
-            title = question_match.group(3).strip()
+            q_num = header_match.group("q_num")
+            mode = header_match.group("mode")
+            title = header_match.group("q_title").strip()
+            block_end = headers[index + 1].start() - 1 if index + 1 < len(headers) else len(content)
             
             current_question_block = [{
                 "q_id": f"q{q_num.zfill(2)}",
@@ -292,10 +281,8 @@ def parse_markdown(md_path: Path) -> dict:
                 "title": title,
                 "order": order,
                 "section_id": current_section_id,
-                "lines": []
+                "content": content[header_match.end() + 1:block_end]
             }]
-        elif current_question_block:
-            current_question_block[0]["lines"].append(line)
     
     # Save last question
     if current_question_block and current_section_id:
@@ -347,14 +334,25 @@ def parse_markdown(md_path: Path) -> dict:
         "primary_manifest_id": "lite"
     }
 
+def _marker_line_range(content: str, marker: str) -> tuple:
+    """Return the indexes of the first and last lines of content containing marker.
+
+    When the marker is absent the first index is one past the last line, so
+    slicing from it yields nothing to scan.
+    """
+    first = content.find(marker)
+    if first == -1:
+        return content.count('\n') + 1, -1
+    return content.count('\n', 0, first), content.count('\n', 0, content.rfind(marker))
+
 def parse_question_content(block_data: list, section_id: str, order: int) -> dict:
     """Parse question content from accumulated lines"""
     if not block_data:
         return None
     
     data = block_data[0]
-    lines = data["lines"]
-    content = '\n'.join(lines)
+    content = data["content"]
+    lines = content.split('\n')
     
     question = {
         "id": data["q_id"],
@@ -368,55 +366,61 @@ def parse_question_content(block_data: list, section_id: str, order: int) -> dic
         "tags": {"included_in_manifests": ["lite", "full"] if data["is_lite"] else ["full"]}
     }
     
-    # Extract type
-    type_match = re.search(r'\*\*Type\*\*:\s*(\w+)', content)
-    if type_match:
-        question["type"] = type_match.group(1).lower()
+    # Extract type (substring checks first so blocks without the marker skip the regex)
+    if "**Type**:" in content:
+        type_match = TYPE_RE.search(content)
+        if type_match:
+            question["type"] = type_match.group(1).lower()
     
     # Extract prompt
-    prompt_match = re.search(r'\*\*Prompt\*\*:\s*["\']?(.+?)["\']?\s*$', content, re.MULTILINE)
-    if prompt_match:
-        question["prompt"] = prompt_match.group(1).strip('"\'')
-    
-    # Extract top-level options (for single_select, multi_select questions)
+    if "**Prompt**:" in content:
+        prompt_match = PROMPT_RE.search(content)
+        if prompt_match:
+            question["prompt"] = prompt_match.group(1).strip('"\'')
+    
+    # Extract top-level options, compound fields (with nested options!) and examples
+    # in one pass. The sections are tracked with separate flags because a marker
+    # that isn't at the start of a line can open one section without closing another.
     options = []
-    in_options = False
-    for line in lines:
+    fields = []
+    examples = []
+    in_options = in_fields = in_examples = False
+    current_field = None
+    current_field_options = []
+    
+    # Lines before the first marker can't open a section; stop once every section
+    # has closed after the last marker
+    first_options, last_options = _marker_line_range(content, "**Options**")
+    first_fields, last_fields = _marker_line_range(content, "**Fields**:")
+    first_examples, last_examples = _marker_line_range(content, "**Examples**:")
+    first = min(first_options, first_fields, first_examples)
+    last = max(last_options, last_fields, last_examples)
+    
+    for i, line in enumerate(lines[first:], first):
+        stripped = line.strip()
+        
+        # Top-level options (for single_select, multi_select questions)
         if "**Options**" in line and ":" in line:
             in_options = True
-            continue
-        if in_options:
-            if line.strip().startswith("- `"):
-                opt_match = re.match(r'-\s*`([^`]+)`:\s*["\']?(.+?)["\']?$', line.strip())
+        elif in_options:
+            if stripped.startswith("- `"):
+                opt_match = OPTION_LINE_RE.match(stripped)
                 if opt_match:
                     options.append({"value": opt_match.group(1), "label": opt_match.group(2).strip('"\'')})
-            elif line.strip().startswith("**") or line.strip().startswith("---"):
+            elif stripped.startswith("**") or stripped.startswith("---"):
                 in_options = False
-    
-    if options:
-        question["options"] = options
-    
-    # Extract fields for compound questions - with nested options!
-    fields = []
-    in_fields = False
-    current_field = None
-    current_field_options = []
-    
-    for line in lines:
+        
+        # Fields for compound questions
         if "**Fields**:" in line:
             in_fields = True
-            continue
-        
-        if in_fields:
-            stripped = line.strip()
-            
+        elif in_fields:
             # Check for new field definition (numbered line)
-            # Pattern: 1. `key` (type): "Label text"
-            # Use a better regex that captures the full label including apostrophes
-            field_match = re.match(r'^\d+\.\s*`([^`]+)`\s*\(([^)]+)\)(?::\s*"([^"]+)")?', stripped)
-            if not field_match:
-                # Try with single quotes
-                field_match = re.match(r"^\d+\.\s*`([^`]+)`\s*\(([^)]+)\)(?::\s*'([^']+)')?", stripped)
+            # Pattern: 1. `key` (type): "Label text" (or 'Label text')
+            # One regex handles both quote styles and keeps apostrophes in the label
+            # (only lines starting with a digit can match, so skip the regex otherwise)
+            field_match = None
+            if stripped[:1].isdigit():
+                field_match = FIELD_QUOTED_RE.match(stripped)
             
             if field_match:
                 # Save previous field with its options
@@ -427,47 +431,13 @@ def parse_question_content(block_data: list, section_id: str, order: int) -> dic
                 
                 # Parse new field
                 key = field_match.group(1)
-                type_info = field_match.group(2)
-                label = field_match.group(3) or key.replace('_', ' ').title()
-                
-                current_field = {"key": key, "label": label.strip(), "type": "short_text"}
+                label = field_match.group(3) or field_match.group(4) or key.replace('_', ' ').title()
+                current_field = _build_field(key, label.strip(), field_match.group(2))
                 current_field_options = []
-                
-                type_info_lower = type_info.lower()
-                if 'ranked_select' in type_info_lower:
-                    current_field["type"] = "ranked_select"
-                elif 'multi_select' in type_info_lower:
-                    current_field["type"] = "multi_select"
-                elif 'single_select' in type_info_lower:
-                    current_field["type"] = "single_select"
-                elif 'number' in type_info_lower:
-                    current_field["type"] = "number"
-                    range_match = re.search(r'(\d+)-(\d+)', type_info)
-                    if range_match:
-                        current_field["min"] = int(range_match.group(1))
-                        current_field["max"] = int(range_match.group(2))
-                elif 'free_text' in type_info_lower:
-                    current_field["type"] = "free_text"
-                elif 'short_text' in type_info_lower:
-                    current_field["type"] = "short_text"
-                
-                if 'optional' in type_info_lower:
-                    current_field["placeholder"] = "Optional"
-                
-                # Check for max selections
-                max_match = re.search(r'max\s*(\d+)', type_info_lower)
-                if max_match and current_field["type"] in ["multi_select", "ranked_select"]:
-                    current_field["validation"] = {"max_selected": int(max_match.group(1))}
-                
-                # Check for showWhen
-                if 'showWhen' in type_info:
-                    show_match = re.search(r'showWhen\s+(\w+)', type_info)
-                    if show_match:
-                        current_field["showWhen"] = {"field": show_match.group(1), "equals": show_match.group(1)}
             
             # Check for nested option (indented with - `)
             elif stripped.startswith("- `") and current_field:
-                opt_match = re.match(r'-\s*`([^`]+)`:\s*["\']?(.+?)["\']?$', stripped)
+                opt_match = OPTION_LINE_RE.match(stripped)
                 if opt_match:
                     current_field_options.append({
                         "value": opt_match.group(1), 
@@ -484,6 +454,18 @@ def parse_question_content(block_data: list, section_id: str, order: int) -> dic
                     current_field = None
                     current_field_options = []
                 in_fields = False
+        
+        # Examples
+        if "**Examples**:" in line:
+            in_examples = True
+        elif in_examples:
+            if stripped.startswith("-"):
+                examples.append(stripped[1:].strip().strip('"\''))
+            elif stripped.startswith("**") or stripped == "---":
+                in_examples = False
+        
+        if i > last and not (in_options or in_fields or in_examples):
+            break
     
     # Don't forget the last field if we're still parsing
     if current_field:
@@ -491,24 +473,13 @@ def parse_question_content(block_data: list, section_id: str, order: int) -> dic
             current_field["options"] = current_field_options
         fields.append(current_field)
     
+    if options:
+        question["options"] = options
+    
     if fields:
         question["fields"] = fields
         question["type"] = "compound"
     
-    # Extract examples
-    examples = []
-    in_examples = False
-    for line in lines:
-        if "**Examples**:" in line:
-            in_examples = True
-            continue
-        if in_examples:
-            if line.strip().startswith("-"):
-                example = line.strip()[1:].strip().strip('"\'')
-                examples.append(example)
-            elif line.strip().startswith("**") or line.strip() == "---":
-                in_examples = False
-    
     if examples:
         question["examples"] = examples
     
@@ -530,7 +501,10 @@ def main():
     print(f"Full: {len(result['manifests']['full']['question_ids'])} questions")
     print(f"Sections: {len(result['sections'])}")
     
-    json_path.write_text(json.dumps(result, indent=2), encoding='utf-8')
+    # Stream into the file rather than building the whole JSON string first; json.dump
+    # emits many small chunks, so a larger buffer keeps the number of write calls down
+    with open(json_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
     print(f"Written: {json_path}")
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+# ./scripts/export_all.py
+"""
+Export All
+==========
+
+Runs the manifest, prompts, questions and schema exports in a single pass. Each phase file
+is parsed once and handed to every exporter that needs it, instead of each export script
+re-reading the same files.
+
+Usage:
+    python scripts/export_all.py
+
+Key Inputs:
+    - data/phase_*/questions.json
+    - data/phase_*/manifest.json
+    - data/phase_*/prompts.json
+
+Key Outputs:
+    - exports/manifests/phase_[id]_manifest.json
+    - exports/prompts/phase_[id]_prompts.txt
+    - exports/questions/phase_[id]_questions.txt
+    - exports/schemas/{phase}_{type}_schema.json
+"""
+
+import json
+import os
+
+import export_manifests
+import export_prompts
+import export_questions
+import export_schemas
+from _export_common import find_phase_dirs, list_files, run_concurrently, write_text_export
+
+# ANSI Colors
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+EXPORT_TYPES = ["manifests", "prompts", "questions", "schemas"]
+
+def export_phase(phase_name, phase_path, export_dirs):
+    """Parses each file of one phase once and runs every exporter on it. Returns [(exported, message or None)]."""
+    results = []
+    present = list_files(phase_path)
+
+    for filename in ["questions.json", "manifest.json", "prompts.json"]:
+        if filename not in present:
+            continue
+        file_path = os.path.join(phase_path, filename)
+
+        try:
+            with open(file_path, 'rb') as f:
+                data = json.loads(f.read())
+        except Exception as e:
+            results.append((False, f"{RED}Error loading {file_path}: {e}{RESET}"))
+            continue
+
+        if filename == "questions.json":
+            results.append(write_text_export(export_questions.convert_to_text, "questions", phase_name, data, export_dirs["questions"]))
+        elif filename == "prompts.json":
+            results.append(write_text_export(export_prompts.convert_to_text, "prompts", phase_name, data, export_dirs["prompts"]))
+        else:
+            # Manifests are copied as-is, so the parsed data is only needed for the schema
+            results.append(export_manifests.export_manifest(phase_name, file_path, export_dirs["manifests"]))
+
+        results.append(export_schemas.write_schema(phase_name, filename, data, export_dirs["schemas"]))
+
+    return results
+
+def main():
+    print(f"{BOLD}Starting Full Export...{RESET}\n")
+
+    base_dir = os.path.join(os.path.dirname(__file__), "..")
+    data_dir = os.path.join(base_dir, "data")
+    export_root = os.path.join(base_dir, "exports")
+
+    export_dirs = {name: os.path.join(export_root, name) for name in EXPORT_TYPES}
+    for path in export_dirs.values():
+        os.makedirs(path, exist_ok=True)
+
+    phase_dirs = find_phase_dirs(data_dir)
+
+    if not phase_dirs:
+        print(f"{RED}No phase directories found.{RESET}")
+        return
+
+    results = run_concurrently(lambda item: export_phase(item[0], item[1], export_dirs), phase_dirs)
+
+    count = 0
+    for phase_results in results:
+        for exported, message in phase_results:
+            if message:
+                print(message)
+            count += exported
+
+    print(f"\n{GREEN}Success! Exported {count} files to {export_root}{RESET}")
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,11 @@ Export Manifests
 Exports all `manifest.json` files from `data/phase_*` directories to `exports/manifests/`.
 
 Usage:
-    python scripts/export_manifests.py
+    python scripts/export_manifests.py [--pretty]
+
+CLI Arguments:
+    --pretty: Re-indent each manifest (load + dump) instead of copying it byte for byte.
+              Without it, manifests whose export is already newer than the source are skipped.
 
 Key Inputs:
     - data/phase_*/manifest.json
@@ -15,18 +19,51 @@ Key Outputs:
     - exports/manifests/phase_[id]_manifest.json
 """
 
+import argparse
 import json
-import glob
 import os
 import shutil
 
+from _export_common import find_phase_files, run_concurrently
+
 # ANSI Colors
 GREEN = "\033[92m"
 RED = "\033[91m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+def export_manifest(phase_dir_name, file_path, export_dir, pretty=False):
+    """Exports one manifest and returns (exported, message)."""
+    target_name = f"{phase_dir_name}_manifest.json"
+    target_path = os.path.join(export_dir, target_name)
+    
+    try:
+        if pretty:
+            # Load and dump to re-indent the manifest
+            with open(file_path, 'rb') as f:
+                data = json.loads(f.read())
+            
+            with open(target_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=4)
+        else:
+            # The source is already JSON, so a plain copy is enough; skip it if the export is current
+            try:
+                if os.path.getmtime(target_path) >= os.path.getmtime(file_path):
+                    return False, f"Up to date {BOLD}{phase_dir_name}{RESET} -> {target_name}"
+            except FileNotFoundError:
+                pass
+            shutil.copyfile(file_path, target_path)
+            
+        return True, f"Exported {BOLD}{phase_dir_name}{RESET} -> {target_name}"
+    except Exception as e:
+        return False, f"{RED}Failed to export {target_name}: {e}{RESET}"
+
 def main():
+    parser = argparse.ArgumentParser(description="Export phase manifests to exports/manifests/")
+    parser.add_argument('--pretty', action='store_true',
+                        help='Re-indent manifests with json.dump instead of copying them')
+    args = parser.parse_args()
+
     print(f"{BOLD}Starting Manifest Export...{RESET}\n")
     
     base_dir = os.path.join(os.path.dirname(__file__), "..")
@@ -35,34 +72,19 @@ def main():
     
     os.makedirs(export_dir, exist_ok=True)
     
-    # Dynamic pattern to catch all phases
-    pattern = os.path.join(data_dir, "phase_*", "manifest.json")
-    files = glob.glob(pattern)
-    files.sort()
+    # Dynamic scan to catch all phases
+    files = find_phase_files(data_dir, "manifest.json")
     
     if not files:
         print(f"{RED}No manifest.json files found.{RESET}")
         return
 
+    results = run_concurrently(lambda item: export_manifest(item[0], item[1], export_dir, args.pretty), files)
+
     count = 0
-    for file_path in files:
-        phase_dir_name = os.path.basename(os.path.dirname(file_path))
-        target_name = f"{phase_dir_name}_manifest.json"
-        target_path = os.path.join(export_dir, target_name)
-        
-        try:
-            # We copy valid JSON to ensure it is formatted nicely? 
-            # Or just copy the file. Let's load and dump to ensure pretty print.
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            with open(target_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-                
-            print(f"Exported {BOLD}{phase_dir_name}{RESET} -> {target_name}")
-            count += 1
-        except Exception as e:
-            print(f"{RED}Failed to export {target_name}: {e}{RESET}")
+    for exported, message in results:
+        print(message)
+        count += exported
                 
     print(f"\n{GREEN}Success! Exported {count} manifest files to {export_dir}{RESET}")
 
@@ -16,30 +16,31 @@ Key Outputs:
     - exports/prompts/phase_[id]_prompts.txt: formatted text file.
 """
 
-import json
-import glob
 import os
 import sys
 
+from _export_common import export_text_file, find_phase_files, run_concurrently
+
 # ANSI Colors
 GREEN = "\033[92m"
 RED = "\033[91m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
-def load_json(path):
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"{RED}Error loading {path}: {e}{RESET}")
-        return None
+# Define a consistent order if possible, or just sort
+PROMPT_ORDER = [
+    "individual_reflection_lite",
+    "individual_reflection_full",
+    "couple_reflection_lite",
+    "couple_reflection_full"
+]
+ORDER_INDEX = {k: i for i, k in enumerate(PROMPT_ORDER)}
 
 def format_list(items, indent_level=0):
     indent = "  " * indent_level
     if not items:
         return f"{indent}(None)"
-    return "\n".join([f"{indent}- {item}" for item in items])
+    return "\n".join(f"{indent}- {item}" for item in items)
 
 def format_output_format(output_schema):
     lines = []
@@ -51,53 +52,38 @@ def format_output_format(output_schema):
     return "\n".join(lines)
 
 def convert_to_text(data, phase_name):
-    lines = []
-    lines.append("=" * 80)
-    lines.append(f"PHASE: {phase_name.upper()}")
-    lines.append("=" * 80)
-    lines.append("")
+    lines = ["=" * 80, f"PHASE: {phase_name.upper()}", "=" * 80, ""]
 
     prompts = data.get("prompts", {})
     
-    # Define a consistent order if possible, or just sort
-    prompt_order = [
-        "individual_reflection_lite",
-        "individual_reflection_full",
-        "couple_reflection_lite",
-        "couple_reflection_full"
-    ]
-    
-    # Get all keys, ensuring we cover any custom ones too, but prioritizing standard ones
-    all_keys = list(prompts.keys())
-    sorted_keys = [k for k in prompt_order if k in all_keys] + [k for k in all_keys if k not in prompt_order]
+    # Standard prompts first in PROMPT_ORDER; custom ones follow in file order (sorted is stable)
+    sorted_keys = sorted(prompts, key=lambda k: ORDER_INDEX.get(k, len(ORDER_INDEX)))
 
     for key in sorted_keys:
         p = prompts[key]
         
-        lines.append("-" * 80)
-        lines.append(f"PROMPT TYPE: {key}")
-        lines.append("-" * 80)
-        lines.append(f"ID:          {p.get('id', 'N/A')}")
-        lines.append(f"TITLE:       {p.get('title', 'N/A')}")
-        lines.append(f"DESCRIPTION: {p.get('description', 'N/A')}")
-        lines.append("")
-        
-        lines.append("ROLE:")
-        lines.append(f"{p.get('role', 'N/A')}")
-        lines.append("")
-        
-        lines.append("CONTEXT:")
-        lines.append(format_list(p.get("context", [])))
-        lines.append("")
-        
-        lines.append("OUTPUT FORMAT:")
-        lines.append(format_output_format(p.get("output_format", [])))
-        lines.append("")
-        
-        lines.append("CONSTRAINTS:")
-        lines.append(format_list(p.get("constraints", [])))
-        lines.append("")
-        lines.append("")
+        lines.extend((
+            "-" * 80,
+            f"PROMPT TYPE: {key}",
+            "-" * 80,
+            f"ID:          {p.get('id', 'N/A')}",
+            f"TITLE:       {p.get('title', 'N/A')}",
+            f"DESCRIPTION: {p.get('description', 'N/A')}",
+            "",
+            "ROLE:",
+            f"{p.get('role', 'N/A')}",
+            "",
+            "CONTEXT:",
+            format_list(p.get("context", [])),
+            "",
+            "OUTPUT FORMAT:",
+            format_output_format(p.get("output_format", [])),
+            "",
+            "CONSTRAINTS:",
+            format_list(p.get("constraints", [])),
+            "",
+            "",
+        ))
 
     return "\n".join(lines)
 
@@ -110,31 +96,19 @@ def main():
     
     os.makedirs(export_dir, exist_ok=True)
     
-    pattern = os.path.join(data_dir, "phase_*", "prompts.json")
-    files = glob.glob(pattern)
-    files.sort()
+    files = find_phase_files(data_dir, "prompts.json")
     
     if not files:
         print(f"{RED}No prompts.json files found.{RESET}")
         return
 
+    results = run_concurrently(lambda item: export_text_file(convert_to_text, "prompts", item[0], item[1], export_dir), files)
+
     count = 0
-    for file_path in files:
-        phase_dir = os.path.basename(os.path.dirname(file_path))
-        target_name = f"{phase_dir}_prompts.txt"
-        target_path = os.path.join(export_dir, target_name)
-        
-        data = load_json(file_path)
-        if data:
-            try:
-                formatted_text = convert_to_text(data, phase_dir)
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(formatted_text)
-                
-                print(f"Exported {BOLD}{phase_dir}{RESET} -> {target_name}")
-                count += 1
-            except Exception as e:
-                print(f"{RED}Failed to write {target_name}: {e}{RESET}")
+    for exported, message in results:
+        if message:
+            print(message)
+        count += exported
                 
     print(f"\n{GREEN}Success! Exported {count} formatted files to {export_dir}{RESET}")
 
@@ -16,33 +16,20 @@ Key Outputs:
     - exports/questions/phase_[id]_questions.txt: formatted text file.
 """
 
-import json
-import glob
 import os
 import sys
 
+from _export_common import export_text_file, find_phase_files, run_concurrently
+
 # ANSI Colors
 GREEN = "\033[92m"
 RED = "\033[91m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
-def load_json(path):
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"{RED}Error loading {path}: {e}{RESET}")
-        return None
-
 def format_options(options, indent_level=2):
     indent = "  " * indent_level
-    lines = []
-    for opt in options:
-        val = opt.get('value', '')
-        lbl = opt.get('label', '')
-        lines.append(f"{indent}- [{val}] {lbl}")
-    return "\n".join(lines)
+    return "\n".join(f"{indent}- [{opt.get('value', '')}] {opt.get('label', '')}" for opt in options)
 
 def format_fields(fields, indent_level=2):
     indent = "  " * indent_level
@@ -57,11 +44,7 @@ def format_fields(fields, indent_level=2):
     return "\n".join(lines)
 
 def convert_to_text(data, phase_name):
-    lines = []
-    lines.append("=" * 80)
-    lines.append(f"PHASE: {phase_name.upper()}")
-    lines.append("=" * 80)
-    lines.append("")
+    lines = ["=" * 80, f"PHASE: {phase_name.upper()}", "=" * 80, ""]
 
     questions = data.get("questions", {})
     sections = data.get("sections", [])
@@ -79,26 +62,20 @@ def convert_to_text(data, phase_name):
         if sec_id != current_section:
             current_section = sec_id
             sec_title = section_map.get(sec_id, sec_id)
-            lines.append("")
-            lines.append(f"### SECTION: {sec_title}")
-            lines.append("-" * 40)
-            lines.append("")
+            lines.extend(("", f"### SECTION: {sec_title}", "-" * 40, ""))
             
         qid = q.get('id', 'N/A')
         title = q.get('title', 'Untitled')
         prompt = q.get('prompt', '')
         qtype = q.get('type', 'unknown')
         
-        lines.append(f"Q{q.get('order', 0)} ({qid}) [{qtype}]: {title}")
-        lines.append(f"PROMPT: {prompt}")
+        lines.extend((f"Q{q.get('order', 0)} ({qid}) [{qtype}]: {title}", f"PROMPT: {prompt}"))
         
         if 'options' in q:
-            lines.append("OPTIONS:")
-            lines.append(format_options(q['options']))
+            lines.extend(("OPTIONS:", format_options(q['options'])))
             
         if 'fields' in q:
-            lines.append("FIELDS:")
-            lines.append(format_fields(q['fields']))
+            lines.extend(("FIELDS:", format_fields(q['fields'])))
             
         lines.append("")
 
@@ -113,31 +90,19 @@ def main():
     
     os.makedirs(export_dir, exist_ok=True)
     
-    pattern = os.path.join(data_dir, "phase_*", "questions.json")
-    files = glob.glob(pattern)
-    files.sort()
+    files = find_phase_files(data_dir, "questions.json")
     
     if not files:
         print(f"{RED}No questions.json files found.{RESET}")
         return
 
+    results = run_concurrently(lambda item: export_text_file(convert_to_text, "questions", item[0], item[1], export_dir), files)
+
     count = 0
-    for file_path in files:
-        phase_dir = os.path.basename(os.path.dirname(file_path))
-        target_name = f"{phase_dir}_questions.txt"
-        target_path = os.path.join(export_dir, target_name)
-        
-        data = load_json(file_path)
-        if data:
-            try:
-                formatted_text = convert_to_text(data, phase_dir)
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(formatted_text)
-                
-                print(f"Exported {BOLD}{phase_dir}{RESET} -> {target_name}")
-                count += 1
-            except Exception as e:
-                print(f"{RED}Failed to write {target_name}: {e}{RESET}")
+    for exported, message in results:
+        if message:
+            print(message)
+        count += exported
                 
     print(f"\n{GREEN}Success! Exported {count} formatted files to {export_dir}{RESET}")
 
@@ -19,9 +19,9 @@ Key Outputs:
 """
 
 import json
-import glob
 import os
-from collections import defaultdict
+
+from _export_common import find_phase_dirs, list_files, run_concurrently
 
 # ANSI Colors
 GREEN = "\033[92m"
@@ -33,39 +33,41 @@ def get_structure(data):
     """
     Recursively extracts the structure (keys and types) of a dictionary or list.
     """
-    if isinstance(data, dict):
+    # JSON only produces plain dicts and lists, so exact type checks are enough
+    data_type = type(data)
+    if data_type is dict:
         structure = {}
         for k, v in data.items():
-            if isinstance(v, (dict, list)):
-                structure[k] = get_structure(v)
-            else:
-                structure[k] = type(v).__name__
+            t = type(v)
+            structure[k] = get_structure(v) if t is dict or t is list else t.__name__
         return structure
-    elif isinstance(data, list):
+    elif data_type is list:
         if not data:
             return "list(empty)"
         
         # If list of dicts, merge structures
-        if all(isinstance(i, dict) for i in data):
+        if all(type(i) is dict for i in data):
             merged_structure = {}
             for item in data:
-                item_structure = get_structure(item)
-                for k, v in item_structure.items():
+                for k, v in item.items():
+                    # The first item with a key wins, so later items' values need not be walked
                     if k not in merged_structure:
-                        merged_structure[k] = v
+                        t = type(v)
+                        merged_structure[k] = get_structure(v) if t is dict or t is list else t.__name__
             return ["list(dict)", merged_structure]
         else:
             return f"list({type(data[0]).__name__})"
     else:
-        return type(data).__name__
+        return data_type.__name__
 
 def analyze_questions_schema(questions_data):
     """
     Specifically analyzes the questions.json structure.
     """
+    answer_schemas_by_type = {}
     schema_summary = {
         "root_keys": list(questions_data.keys()),
-        "answer_schemas_by_type": defaultdict(dict)
+        "answer_schemas_by_type": answer_schemas_by_type
     }
     
     questions = questions_data.get("questions", {})
@@ -74,14 +76,49 @@ def analyze_questions_schema(questions_data):
             q_type = q_data.get("type", "unknown")
             a_schema = q_data.get("answer_schema", {})
             
-            if q_type not in schema_summary["answer_schemas_by_type"]:
-                 schema_summary["answer_schemas_by_type"][q_type] = {}
-            
-            for k in a_schema.keys():
-                schema_summary["answer_schemas_by_type"][q_type][k] = type(a_schema[k]).__name__
+            # Types keep first-seen order, so the snapshot key order is unchanged
+            type_schema = answer_schemas_by_type.setdefault(q_type, {})
+            for k, v in a_schema.items():
+                type_schema[k] = type(v).__name__
 
     return schema_summary
 
+def export_schema(phase_name, phase_path, filename, export_dir):
+    """Exports the schema snapshot of one phase file and returns (exported, message)."""
+    file_path = os.path.join(phase_path, filename)
+    
+    try:
+        with open(file_path, 'rb') as f:
+            data = json.loads(f.read())
+    except Exception as e:
+        return False, f"{RED}Error processing {phase_name}/{filename}: {e}{RESET}"
+    
+    return write_schema(phase_name, filename, data, export_dir)
+
+def write_schema(phase_name, filename, data, export_dir):
+    """Writes the schema snapshot for already-parsed file data and returns (exported, message)."""
+    try:
+        # Generate schema logic
+        if filename == "questions.json":
+            schema_snapshot = analyze_questions_schema(data)
+            schema_snapshot["full_structure_sample"] = get_structure(data)
+        else:
+            schema_snapshot = get_structure(data)
+        
+        # Output file name: phase_0_questions_schema.json
+        base_name = filename.replace('.json', '')
+        target_name = f"{phase_name}_{base_name}_schema.json"
+        target_path = os.path.join(export_dir, target_name)
+        
+        with open(target_path, 'w', encoding='utf-8') as f:
+            # Encode in one go and write once; json.dump with indent issues a write per token
+            f.write(json.dumps(schema_snapshot, indent=4))
+        
+        return True, f"Exported {BOLD}{target_name}{RESET}"
+        
+    except Exception as e:
+        return False, f"{RED}Error processing {phase_name}/{filename}: {e}{RESET}"
+
 def main():
     print(f"{BOLD}Starting Schema Export...{RESET}\n")
     
@@ -92,46 +129,26 @@ def main():
     os.makedirs(export_dir, exist_ok=True)
     
     # Dynamic: find all phase directories
-    phase_dirs = glob.glob(os.path.join(data_dir, "phase_*"))
-    phase_dirs.sort()
+    phase_dirs = find_phase_dirs(data_dir)
     
     if not phase_dirs:
         print(f"{RED}No phase directories found.{RESET}")
         return
 
-    count = 0
-    for phase_path in phase_dirs:
-        phase_name = os.path.basename(phase_path)
-        
+    # Flatten to (phase, file) jobs so every file is exported concurrently
+    jobs = []
+    for phase_name, phase_path in phase_dirs:
+        present = list_files(phase_path)
         for filename in ["questions.json", "manifest.json", "prompts.json"]:
-            file_path = os.path.join(phase_path, filename)
-            if not os.path.exists(file_path):
-                continue
-                
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Generate schema logic
-                if filename == "questions.json":
-                    schema_snapshot = analyze_questions_schema(data)
-                    schema_snapshot["full_structure_sample"] = get_structure(data)
-                else:
-                    schema_snapshot = get_structure(data)
-                
-                # Output file name: phase_0_questions_schema.json
-                base_name = filename.replace('.json', '')
-                target_name = f"{phase_name}_{base_name}_schema.json"
-                target_path = os.path.join(export_dir, target_name)
-                
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    json.dump(schema_snapshot, f, indent=4)
-                
-                print(f"Exported {BOLD}{target_name}{RESET}")
-                count += 1
-                
-            except Exception as e:
-                print(f"{RED}Error processing {phase_name}/{filename}: {e}{RESET}")
+            if filename in present:
+                jobs.append((phase_name, phase_path, filename))
+
+    results = run_concurrently(lambda job: export_schema(*job, export_dir), jobs)
+
+    count = 0
+    for exported, message in results:
+        print(message)
+        count += exported
 
     print(f"\n{GREEN}Success! Exported {count} schema files to {export_dir}{RESET}")
 
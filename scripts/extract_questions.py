@@ -32,6 +32,7 @@ GitHub: https://github.com/imyourboyroy
 
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -45,14 +46,14 @@ def extract_questions(phase_name: str) -> None:
         print(f"ERROR: {questions_file} not found")
         return
     
-    with open(questions_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(questions_file, 'rb') as f:
+        data = json.loads(f.read())
     
     # Load manifest for phase title
     phase_title = phase_name
     if manifest_file.exists():
-        with open(manifest_file, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        with open(manifest_file, 'rb') as f:
+            manifest = json.loads(f.read())
             phase_title = manifest.get("artifact", {}).get("title", phase_name)
     
     sections = {s["id"]: s["title"] for s in data.get("sections", [])}
@@ -72,16 +73,18 @@ def extract_questions(phase_name: str) -> None:
     
     # Group questions by section
     current_section = None
-    for qid in sorted(questions.keys(), key=lambda x: questions[x].get("order", 0)):
-        q = questions[qid]
+    # Sort (id, question) pairs so each question is fetched once; ties keep file order
+    for qid, q in sorted(questions.items(), key=lambda item: item[1].get("order", 0)):
         section_id = q.get("section_id", "unknown")
+        # Collect the block's lines and write them in one call instead of a print per line
+        parts = []
         
         if section_id != current_section:
             current_section = section_id
             section_title = sections.get(section_id, "Unknown Section")
-            print(f"\n{'-' * 100}")
-            print(f"SECTION: {section_title}")
-            print(f"{'-' * 100}")
+            parts.append(f"\n{'-' * 100}")
+            parts.append(f"SECTION: {section_title}")
+            parts.append(f"{'-' * 100}")
         
         # Determine manifest inclusion
         in_lite = qid in lite_ids
@@ -93,15 +96,15 @@ def extract_questions(phase_name: str) -> None:
         title = q.get("title", "")
         examples = q.get("examples", [])
         
-        print(f"\n[{qid}] [{q_type.upper()}] [{manifest_tag}]")
-        print(f"  Title: {title}")
-        print(f"  Prompt: {prompt}")
+        parts.append(f"\n[{qid}] [{q_type.upper()}] [{manifest_tag}]")
+        parts.append(f"  Title: {title}")
+        parts.append(f"  Prompt: {prompt}")
         
         # Show options for select types
         if q_type in ["single_select", "multi_select"]:
             options = q.get("options", [])
             if options:
-                print(f"  Options: {', '.join([o.get('label', '') for o in options])}")
+                parts.append(f"  Options: {', '.join([o.get('label', '') for o in options])}")
         
         # Show fields for compound types
         if q_type == "compound":
@@ -118,13 +121,15 @@ def extract_questions(phase_name: str) -> None:
                 
                 field_options = field.get("options", [])
                 if field_options:
-                    print(f"    - {field_key} ({field_type}): {field_label}{show_condition}")
-                    print(f"      Options: {', '.join([o.get('label', '') for o in field_options])}")
+                    parts.append(f"    - {field_key} ({field_type}): {field_label}{show_condition}")
+                    parts.append(f"      Options: {', '.join([o.get('label', '') for o in field_options])}")
                 else:
-                    print(f"    - {field_key} ({field_type}): {field_label}{show_condition}")
+                    parts.append(f"    - {field_key} ({field_type}): {field_label}{show_condition}")
         
         if examples:
-            print(f"  Examples: {examples[:2]}{'...' if len(examples) > 2 else ''}")
+            parts.append(f"  Examples: {examples[:2]}{'...' if len(examples) > 2 else ''}")
+        
+        sys.stdout.write("\n".join(parts) + "\n")
     
     print(f"\n{'=' * 100}\n")
 
@@ -139,7 +144,8 @@ def main():
     
     if phase_arg == "all":
         # Find all phase directories
-        phases = [d.name for d in data_dir.iterdir() if d.is_dir() and d.name.startswith("phase")]
+        with os.scandir(data_dir) as entries:
+            phases = [d.name for d in entries if d.name.startswith("phase") and d.is_dir()]
         phases.sort()
     else:
         phases = [phase_arg]
@@ -21,7 +21,9 @@ Outputs:
 
 import json
 import os
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from _export_common import list_files
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -32,42 +34,42 @@ def get_structure(data):
     Recursively extracts the structure (keys and types) of a dictionary or list.
     For lists of dicts, it merges keys from all items to show a superset of possible keys.
     """
-    if isinstance(data, dict):
+    # JSON only produces plain dicts and lists, so exact type checks are enough
+    data_type = type(data)
+    if data_type is dict:
         structure = {}
         for k, v in data.items():
-            if isinstance(v, (dict, list)):
-                structure[k] = get_structure(v)
-            else:
-                structure[k] = type(v).__name__
+            t = type(v)
+            structure[k] = get_structure(v) if t is dict or t is list else t.__name__
         return structure
-    elif isinstance(data, list):
+    elif data_type is list:
         if not data:
             return "list(empty)"
         
         # If list of dicts, merge structures
-        if all(isinstance(i, dict) for i in data):
+        if all(type(i) is dict for i in data):
             merged_structure = {}
             for item in data:
-                item_structure = get_structure(item)
-                for k, v in item_structure.items():
+                for k, v in item.items():
+                    # The first item with a key wins, so later items' values need not be walked
                     if k not in merged_structure:
-                        merged_structure[k] = v
-                    # Could add logic here to handle conflicting types, but keeping simple for now
+                        t = type(v)
+                        merged_structure[k] = get_structure(v) if t is dict or t is list else t.__name__
             return ["list(dict)", merged_structure]
         else:
-            # List of primitives or mixed, just grab type of first non-null
             return f"list({type(data[0]).__name__})"
     else:
-        return type(data).__name__
+        return data_type.__name__
 
 def analyze_questions_schema(questions_data):
     """
     Specifically analyzes the questions.json structure.
     Returns a summary of answer_schemas by question type.
     """
+    answer_schemas_by_type = {}
     schema_summary = {
         "root_keys": list(questions_data.keys()),
-        "answer_schemas_by_type": defaultdict(dict)
+        "answer_schemas_by_type": answer_schemas_by_type
     }
     
     questions = questions_data.get("questions", {})
@@ -77,30 +79,23 @@ def analyze_questions_schema(questions_data):
             q_type = q_data.get("type", "unknown")
             a_schema = q_data.get("answer_schema", {})
             
-            # Record keys found in answer_schema for this type
-            if q_type not in schema_summary["answer_schemas_by_type"]:
-                 schema_summary["answer_schemas_by_type"][q_type] = {}
-            
-            # Merge keys (simple update for this audit)
-            for k in a_schema.keys():
-                schema_summary["answer_schemas_by_type"][q_type][k] = type(a_schema[k]).__name__
+            # Record keys found in answer_schema for this type; types keep first-seen order
+            type_schema = answer_schemas_by_type.setdefault(q_type, {})
+            for k, v in a_schema.items():
+                type_schema[k] = type(v).__name__
 
     return schema_summary
 
 def process_file(phase, filename):
+    """Generates the schema snapshot for one phase file and returns the message to print."""
     phase_dir = os.path.join(DATA_DIR, phase)
     file_path = os.path.join(phase_dir, filename)
-    
-    if not os.path.exists(file_path):
-        print(f"Skipping {phase}/{filename} (not found)")
-        return
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = json.loads(f.read())
     except Exception as e:
-        print(f"Error reading {phase}/{filename}: {e}")
-        return
+        return f"Error reading {phase}/{filename}: {e}"
 
     # Determine schema definition
     if filename == "questions.json":
@@ -116,15 +111,27 @@ def process_file(phase, filename):
     output_path = os.path.join(phase_dir, output_filename)
 
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(schema_snapshot, f, indent=4)
+        # Encode in one go and write once; json.dump with indent issues a write per token
+        f.write(json.dumps(schema_snapshot, indent=4))
     
-    print(f"Generated {output_filename}")
+    return f"Generated {output_filename}"
 
 def main():
     print("Starting schema snapshot generation...")
-    for phase in PHASES:
-        for filename in ["questions.json", "manifest.json", "prompts.json"]:
-            process_file(phase, filename)
+    # Files are independent, so they are read and snapshotted concurrently; messages keep scan order
+    results = []
+    with ThreadPoolExecutor() as executor:
+        for phase in PHASES:
+            # One directory listing per phase instead of an exists() check per file
+            present = list_files(os.path.join(DATA_DIR, phase))
+            for filename in ["questions.json", "manifest.json", "prompts.json"]:
+                if filename not in present:
+                    results.append(f"Skipping {phase}/{filename} (not found)")
+                    continue
+                results.append(executor.submit(process_file, phase, filename))
+
+    for result in results:
+        print(result if isinstance(result, str) else result.result())
     print("Generation complete.")
 
 if __name__ == "__main__":